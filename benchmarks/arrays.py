@@ -0,0 +1,51 @@
+'''Benchmark per source numeric parameters stored as python objects against ArrayConfig.
+
+Writes and reads a table of initial guesses and bounds for a number of sources,
+once as lists in a BaseConfig (YAML scalars) and once as a structured array in
+an ArrayConfig (memory mapped .npy sidecar). Requires numpy. Run from the
+repository root:
+
+    python benchmarks/arrays.py
+'''
+# buildin
+from pathlib import Path
+from time import perf_counter
+import tempfile
+
+# dependencies
+import numpy
+
+# package
+from configlib import Config, BaseConfig, ArrayConfig
+
+def build(sources:int, arrays:bool) -> Config:
+    table = numpy.zeros(sources, dtype=[('guess', 'f8'), ('lower', 'f8'), ('upper', 'f8')])
+    table['guess'] = numpy.linspace(0, 1, sources)
+    table['upper'] = 2
+
+    cfg = Config()
+    if arrays:
+        cfg.add_group('sources', ArrayConfig).add_parameter('table', table)
+    else:
+        cfg.add_group('sources', BaseConfig).add_parameters({field:table[field].tolist() for field in table.dtype.names})
+    return cfg
+
+def timed(function) -> tuple[float, object]:
+    start = perf_counter()
+    result = function()
+    return (perf_counter() - start)*1e3, result
+
+def run():
+    print(f'{"sources":>8} {"storage":>8} {"write [ms]":>11} {"read [ms]":>10} {"access [ms]":>12}')
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for sources in [1000, 10000, 100000]:
+            for arrays in [False, True]:
+                cfg = build(sources, arrays)
+                fpath = Path(tmpdir)/f'config{sources}{arrays}.yml'
+                write, _ = timed(lambda: cfg.writeto(fpath))
+                read, loaded = timed(lambda: Config.readfrom(fpath, cache=False))
+                access, _ = timed(lambda: numpy.asarray(loaded.guess).mean())
+                print(f'{sources:>8} {"array" if arrays else "yaml":>8} {write:>11.1f} {read:>10.1f} {access:>12.2f}')
+
+if __name__ == '__main__':
+    run()
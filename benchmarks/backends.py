@@ -0,0 +1,37 @@
+'''Benchmark dump and load throughput of the serialisation backends of ConfigIO.
+
+Measures every registered backend on the same tree, through the backend itself
+(no file system) and reading through ConfigIO.readfrom without the snapshot
+cache. Run from the repository root:
+
+    python benchmarks/backends.py
+'''
+# buildin
+from pathlib import Path
+from timeit import timeit
+import tempfile
+
+# package
+from configlib import Config, ConfigIO
+from configlib import configlib
+from trees import build_tree
+
+def run(number:int=3):
+    cfg = build_tree(depth=10, width=10, params=50)
+    backends = {backend.name:backend for backend in ConfigIO.backends.values()}
+
+    print(f'orjson available: {configlib._optional_("orjson") is not None}, msgpack available: {configlib._optional_("msgpack") is not None}')
+    print(f'{"backend":<10} {"size [kB]":>10} {"dump [ms]":>10} {"load [ms]":>10} {"readfrom [ms]":>14}')
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, backend in backends.items():
+            data = backend.dumps(cfg._tree)
+            dumptime = timeit(lambda: backend.dumps(cfg._tree), number=number)/number*1e3
+            loadtime = timeit(lambda: backend.loads(data), number=number)/number*1e3
+
+            fpath = Path(tmpdir)/f'config{backend.extensions[0]}'
+            cfg.writeto(fpath)
+            readtime = timeit(lambda: Config.readfrom(fpath, cache=False), number=number)/number*1e3
+            print(f'{name:<10} {len(data)/1e3:>10.1f} {dumptime:>10.1f} {loadtime:>10.1f} {readtime:>14.1f}')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,47 @@
+'''Benchmark registering many generated parameters.
+
+Compares calling add_parameter once per parameter against the bulk
+add_parameters, and building a nested config group by group against
+Config.from_dict. Run from the repository root:
+
+    python benchmarks/bulk.py
+'''
+# buildin
+from timeit import timeit
+
+# package
+from configlib import Config, BaseConfig
+
+def per_call(parameters:dict) -> BaseConfig:
+    group = BaseConfig(name='group', strict=False)
+    for alias, value in parameters.items():
+        group.add_parameter(alias, value)
+    return group
+
+def bulk(parameters:dict) -> BaseConfig:
+    group = BaseConfig(name='group', strict=False)
+    group.add_parameters(parameters)
+    return group
+
+def nested_per_call(tree:dict) -> Config:
+    cfg = Config()
+    for alias, parameters in tree.items():
+        group = cfg.add_group(alias, BaseConfig)
+        for key, value in parameters.items():
+            group.add_parameter(key, value)
+    return cfg
+
+def run(number:int=5):
+    print(f'{"params":>7} {"per call [ms]":>14} {"bulk [ms]":>10} {"speedup":>8}   {"nested [ms]":>12} {"from_dict [ms]":>15} {"speedup":>8}')
+    for count in [100, 1000, 10000]:
+        parameters = {f'p{n}':n for n in range(count)}
+        tree = {f'g{n}':{f'p{n}_{m}':m for m in range(100)} for n in range(count//100)}
+
+        loop = timeit(lambda: per_call(parameters), number=number)/number*1e3
+        once = timeit(lambda: bulk(parameters), number=number)/number*1e3
+        nested = timeit(lambda: nested_per_call(tree), number=number)/number*1e3
+        fromdict = timeit(lambda: Config.from_dict(tree), number=number)/number*1e3
+        print(f'{count:>7} {loop:>14.2f} {once:>10.2f} {loop/once:>8.1f}   {nested:>12.2f} {fromdict:>15.2f} {nested/fromdict:>8.1f}')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,49 @@
+'''Benchmark keying cached results by the config that produced them.
+
+Compares hashing a YAML dump of the whole config against Config.fingerprint,
+after changing one parameter deep in the tree. The fingerprint only hashes the
+groups on the path to the change again, and the fingerprint of the groups a
+stage depends on does not change at all. Run from the repository root:
+
+    python benchmarks/fingerprint.py
+'''
+# buildin
+from timeit import timeit
+import hashlib
+
+# package
+from trees import build_tree
+from configlib import ConfigIO
+
+def run(number:int=20):
+    print(f'{"depth, width, params":>22} {"yaml dump [ms]":>15} {"fingerprint [ms]":>17} {"stage [ms]":>11}')
+    for tree in [(2, 4, 10), (5, 10, 25), (20, 10, 50)]:
+        cfg = build_tree(*tree)
+        value = iter(range(10**9))
+
+        def change():
+            # one parameter in the first group, stage depends on the last group only
+            cfg.add_parameter('changed', next(value), group='g0_0', overwrite=True)
+
+        def dump():
+            change()
+            return hashlib.blake2b(ConfigIO.backend(None, 'yaml').dumps(cfg._tree)).hexdigest()
+
+        def fingerprint():
+            change()
+            return cfg.fingerprint()
+
+        stage = [f'g0_{tree[1]-1}']
+        def stage_fingerprint():
+            change()
+            return cfg.fingerprint(stage)
+
+        times = list()
+        for function in (dump, fingerprint, stage_fingerprint):
+            # hash everything once, as a long running pipeline would have
+            function()
+            times.append(timeit(function, number=number)/number*1e3)
+        print(f'{str(tree):>22} {times[0]:>15.2f} {times[1]:>17.3f} {times[2]:>11.3f}')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,44 @@
+'''Benchmark attribute access latency and memory per group of frozen configs.
+
+Compares a regular config against its frozen (compiled, slotted) counterpart,
+both for a flattened alias and for walking down the groups. Run from the
+repository root:
+
+    python benchmarks/frozen.py
+'''
+# buildin
+from timeit import timeit
+import tracemalloc
+
+# package
+from trees import build_tree
+
+def allocated(function) -> tuple[object, int]:
+    # return result of function and the memory it allocated in bytes
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+def run(number:int=100000):
+    depth, width, params = 5, 10, 20
+    groups = depth*width
+
+    def regular_tree():
+        # a regular config as used for lookups, including its alias index
+        cfg = build_tree(depth, width, params)
+        cfg._handler.index(cfg)
+        return cfg
+
+    cfg, regular = allocated(regular_tree)
+    frozen, compiled = allocated(cfg.freeze)
+
+    print(f'{"config":>8} {"flat [ns]":>10} {"nested [ns]":>12} {"memory/group [kB]":>18}')
+    for name, obj, memory in [('regular', cfg, regular), ('frozen', frozen, compiled)]:
+        flat = timeit(lambda: obj.p4_9_19, number=number)/number*1e9
+        nested = timeit(lambda: obj.g0_9.g1_9.p1_9_19, number=number)/number*1e9
+        print(f'{name:>8} {flat:>10.1f} {nested:>12.1f} {memory/groups/1e3:>18.2f}')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,41 @@
+'''Benchmark time and peak memory to the first parameter of a large config file.
+
+Compares reading the full file against the lazy read mode, which only constructs
+the groups that are accessed. Run from the repository root:
+
+    python benchmarks/lazy.py
+'''
+# buildin
+from pathlib import Path
+from time import perf_counter
+import tempfile
+import tracemalloc
+
+# package
+from configlib import Config
+from trees import build_tree
+
+def first_access(fpath:Path, lazy:bool) -> tuple[float, float]:
+    # return time [ms] and peak memory [MB] of reading fpath and accessing one parameter
+    tracemalloc.start()
+    start = perf_counter()
+    cfg = Config.readfrom(fpath, cache=False, lazy=lazy)
+    cfg.p0_1_1
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[-1]
+    tracemalloc.stop()
+    return elapsed*1e3, peak/1e6
+
+def run():
+    print(f'{"groups":>7} {"size [MB]":>10} {"eager [ms]":>11} {"eager [MB]":>11} {"lazy [ms]":>10} {"lazy [MB]":>10}')
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for width in [10, 100, 1000]:
+            fpath = Path(tmpdir)/f'config{width}.yml'
+            build_tree(depth=1, width=width, params=50).writeto(fpath)
+
+            eager = first_access(fpath, lazy=False)
+            lazy = first_access(fpath, lazy=True)
+            print(f'{width:>7} {fpath.stat().st_size/1e6:>10.2f} {eager[0]:>11.1f} {eager[1]:>11.2f} {lazy[0]:>10.1f} {lazy[1]:>10.2f}')
+
+if __name__ == '__main__':
+    run()
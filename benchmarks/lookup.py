@@ -0,0 +1,39 @@
+'''Benchmark alias lookup cost as a function of tree size and depth.
+
+Compares the indexed dot search of Config against the original recursive
+depth first search over every _tree. Run from the repository root:
+
+    python benchmarks/lookup.py
+'''
+# buildin
+from timeit import timeit
+
+# package
+from trees import build_tree
+
+def dive_tree(child, __name):
+    # reference implementation: recursive search as done before the alias index
+    if __name in child._tree:
+        return child._tree[__name]
+    for child in child._tree.values():
+        if hasattr(child, '_tree'):
+            res = dive_tree(child, __name)
+            if not res is None:
+                return res
+
+def run(number:int=10000):
+    print(f'{"depth":>6} {"width":>6} {"params":>7} {"aliases":>8} {"indexed [us]":>13} {"recursive [us]":>15}')
+    for depth, width, params in [(2, 4, 10), (5, 8, 25), (10, 10, 50), (20, 10, 50), (40, 10, 50)]:
+        cfg = build_tree(depth, width, params)
+
+        # deepest and last registered alias is the worst case for the recursive search
+        alias = f'p{depth-1}_{width-1}_{params-1}'
+        size = len(cfg._handler.index(cfg))
+        assert getattr(cfg, alias) == dive_tree(cfg, alias)
+
+        indexed = timeit(lambda: getattr(cfg, alias), number=number)/number*1e6
+        recursive = timeit(lambda: dive_tree(cfg, alias), number=number//100)/(number//100)*1e6
+        print(f'{depth:>6} {width:>6} {params:>7} {size:>8} {indexed:>13.3f} {recursive:>15.3f}')
+
+if __name__ == '__main__':
+    run()
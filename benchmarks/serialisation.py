@@ -0,0 +1,36 @@
+'''Benchmark YAML dump and load throughput of a config tree.
+
+Compares the safe tagged representation (libyaml when available) against the
+python object representation with the pure python full Loader used before.
+Run from the repository root:
+
+    python benchmarks/serialisation.py
+'''
+# buildin
+from timeit import timeit
+
+# dependencies
+import yaml
+
+# package
+from configlib.configlib import ConfigLoader, ConfigDumper
+from trees import build_tree
+
+def run(number:int=3):
+    cfg = build_tree(depth=10, width=10, params=50)
+
+    paths = {
+        'tagged (safe)': (ConfigDumper, ConfigLoader),
+        'python object (full)': (yaml.Dumper, yaml.Loader),
+    }
+
+    print(f'libyaml available: {yaml.__with_libyaml__}')
+    print(f'{"path":<22} {"size [kB]":>10} {"dump [ms]":>10} {"load [ms]":>10}')
+    for name, (dumper, loader) in paths.items():
+        text = yaml.dump(cfg._tree, Dumper=dumper, sort_keys=False)
+        dumptime = timeit(lambda: yaml.dump(cfg._tree, Dumper=dumper, sort_keys=False), number=number)/number*1e3
+        loadtime = timeit(lambda: yaml.load(text, loader), number=number)/number*1e3
+        print(f'{name:<22} {len(text)/1e3:>10.1f} {dumptime:>10.1f} {loadtime:>10.1f}')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,49 @@
+'''Benchmark handing a config to worker processes.
+
+Compares sending a pickled copy of the config to every worker against sending a
+shared memory snapshot, which workers attach to by name. Reports the time to
+unpickle or attach and the growth of the resident set of each worker. Run from
+the repository root:
+
+    python benchmarks/shared.py
+'''
+# buildin
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+import os
+import pickle
+
+# package
+from trees import build_tree
+
+def rss() -> int:
+    # resident set size in bytes (linux)
+    with open('/proc/self/statm') as fp:
+        return int(fp.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+
+def receive(payload:bytes, alias:str) -> tuple[float, int]:
+    # unpickle payload in the worker and do a single lookup
+    before = rss()
+    start = perf_counter()
+    cfg = pickle.loads(payload)
+    getattr(cfg, alias)
+    elapsed = perf_counter() - start
+    return elapsed, rss() - before
+
+def run(workers:int=4):
+    print(f'{"params":>7} {"method":>8} {"payload [kB]":>13} {"receive [ms]":>13} {"rss [MB]":>9}')
+    for width in [10, 100, 1000]:
+        cfg = build_tree(depth=2, width=width, params=50)
+        alias = f'p1_{width-1}_49'
+
+        with cfg.share() as shared:
+            for method, obj in [('pickle', cfg), ('shared', shared)]:
+                payload = pickle.dumps(obj, protocol=5)
+                with ProcessPoolExecutor(workers) as pool:
+                    results = list(pool.map(receive, [payload]*workers, [alias]*workers))
+                elapsed = sum(result[0] for result in results)/workers
+                memory = sum(result[1] for result in results)/workers
+                print(f'{2*width*50:>7} {method:>8} {len(payload)/1e3:>13.1f} {elapsed*1e3:>13.2f} {memory/1e6:>9.2f}')
+
+if __name__ == '__main__':
+    run()
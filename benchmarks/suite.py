@@ -0,0 +1,300 @@
+'''Benchmark suite of configlib.
+
+The benchmarks are written in the style of airspeed velocity (asv): every class
+has a list of params, a setup method and time_* methods, such that asv can run
+them as is. Without asv, run them with the runner in this file from the
+repository root, which saves the results as json such that they can be compared
+between commits:
+
+    python benchmarks/suite.py                            # saves benchmarks/results/<commit>.json
+    python benchmarks/suite.py --filter Lookup            # only run matching benchmarks
+    python benchmarks/suite.py --compare old.json new.json
+'''
+# buildin
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from itertools import product
+from pathlib import Path
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+import warnings
+
+# package
+from configlib import Config, ConfigIO, ConfigFormatter, FileConfig, ConcurrentConfig, ArgumentParserWithFallback
+from trees import build_tree, last_alias, build_directories
+
+RESULTS = Path(__file__).parent/'results'
+TREES = [(2, 4, 10), (5, 10, 25), (20, 10, 50)]
+
+class Lookup:
+    # ConfigHandler.__getattr__ through the dot search
+    params = [TREES]
+    param_names = ['depth, width, params']
+
+    def setup(self, tree):
+        self.cfg = build_tree(*tree)
+        self.strict = build_tree(*tree, strict=True)
+        self.alias = last_alias(*tree)
+
+        # build index outside of the measurement
+        getattr(self.cfg, self.alias)
+        getattr(self.strict, self.alias)
+
+    def time_hit(self, tree):
+        getattr(self.cfg, self.alias)
+
+    def time_hit_group(self, tree):
+        self.cfg.g0_0
+
+    def time_miss_warn(self, tree):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.cfg.unregistered
+
+    def time_miss_strict(self, tree):
+        try:
+            self.strict.unregistered
+        except AttributeError:
+            pass
+
+    def time_get_hit(self, tree):
+        self.cfg.get(self.alias)
+
+    def time_get_miss(self, tree):
+        self.cfg.get('unregistered', None)
+
+    def time_get_many(self, tree):
+        self.cfg.get_many([self.alias, 'unregistered', 'g0_0'])
+
+class IO:
+    # ConfigIO.writeto and ConfigIO.readfrom
+    params = [TREES]
+    param_names = ['depth, width, params']
+
+    def setup(self, tree):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cfg = build_tree(*tree)
+        self.fpath = Path(self.tmpdir.name)/'config.yml'
+        ConfigIO.writeto(self.cfg, self.fpath)
+
+        # compiled snapshot for the cached read
+        ConfigIO.readfrom(Config, self.fpath, cache=True)
+
+    def teardown(self, tree):
+        self.tmpdir.cleanup()
+
+    def time_writeto(self, tree):
+        ConfigIO.writeto(self.cfg, Path(self.tmpdir.name)/'written.yml')
+
+    def time_writeto_one_changed(self, tree):
+        # only the group of the changed parameter is serialised again
+        self.cfg.add_parameter('changed', 0, overwrite=True)
+        ConfigIO.writeto(self.cfg, Path(self.tmpdir.name)/'written.yml', reuse=True)
+
+    def time_writeto_fsync(self, tree):
+        ConfigIO.writeto(self.cfg, Path(self.tmpdir.name)/'written.yml', fsync=True)
+
+    def time_readfrom(self, tree):
+        ConfigIO.readfrom(Config, self.fpath, cache=False)
+
+    def time_readfrom_cached(self, tree):
+        ConfigIO.readfrom(Config, self.fpath, cache=True)
+
+    def time_readfrom_lazy(self, tree):
+        ConfigIO.readfrom(Config, self.fpath, lazy=True).g0_0
+
+class Format:
+    # ConfigFormatter.format of the whole tree
+    params = [TREES]
+    param_names = ['depth, width, params']
+
+    def setup(self, tree):
+        self.cfg = build_tree(*tree)
+
+    def time_format(self, tree):
+        ConfigFormatter.format(self.cfg)
+
+    def time_format_limited(self, tree):
+        ConfigFormatter.format(self.cfg, max_depth=2, max_children=5)
+
+class Fork:
+    # copy-on-write forks of the whole tree
+    params = [TREES]
+    param_names = ['depth, width, params']
+
+    def setup(self, tree):
+        self.cfg = build_tree(*tree)
+        self.alias = last_alias(*tree)
+        getattr(self.cfg, self.alias)
+
+    def time_fork(self, tree):
+        self.cfg.fork()
+
+    def time_fork_override(self, tree):
+        # fork, change one parameter deep in the tree and look it up
+        fork = self.cfg.fork()
+        fork.add_parameter('changed', 0, group='g0_0', overwrite=True)
+        getattr(fork, self.alias)
+
+class Concurrent:
+    # publishing a batch of one change to a ConcurrentConfig, and lookups on the published version
+    params = [TREES]
+    param_names = ['depth, width, params']
+
+    def setup(self, tree):
+        self.shared = ConcurrentConfig(build_tree(*tree))
+        self.alias = last_alias(*tree)
+        self.value = 0
+
+    def time_publish(self, tree):
+        self.value += 1
+        with self.shared.write() as draft:
+            draft.add_parameter('changed', self.value, group='g0_0', overwrite=True)
+
+    def time_lookup(self, tree):
+        getattr(self.shared.config, self.alias)
+
+class FileRegistration:
+    # FileConfig registration and verification of existing directories
+    params = [[10, 100, 1000]]
+    param_names = ['directories']
+
+    def setup(self, count):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.paths = build_directories(self.tmpdir.name, count)
+
+    def teardown(self, count):
+        self.tmpdir.cleanup()
+
+    def time_add_parameter(self, count):
+        files = FileConfig(name='files', strict=False)
+        for n, path in enumerate(self.paths):
+            files.add_parameter(f'dir{n}', path)
+
+    def time_set_tree(self, count):
+        FileConfig(name='files', strict=False).set_tree({f'dir{n}':path for n, path in enumerate(self.paths)})
+
+    def time_verified(self, count):
+        files = FileConfig(name='files', strict=False)
+        files._tree.update({f'dir{n}':path for n, path in enumerate(self.paths)})
+        files.verified()
+
+class ArgumentParsing:
+    # ArgumentParserWithFallback resolving arguments that were not given from the config
+    params = [[10, 100, 500]]
+    param_names = ['arguments']
+
+    def setup(self, count):
+        self.cfg = build_tree(depth=5, width=10, params=count//10)
+        self.aliases = [f'p{n % 5}_{n % 10}_{n // 10 % (count//10)}' for n in range(count)]
+        self.argv = sys.argv
+        sys.argv = [sys.argv[0]]
+
+        self.parser = ArgumentParserWithFallback(fallback=self.cfg)
+        self.environ = ArgumentParserWithFallback(fallback=self.cfg, env_prefix='CONFIGLIB_BENCH_')
+        for alias in self.aliases:
+            self.parser.add_argument(f'--{alias}', default=None)
+            self.environ.add_argument(f'--{alias}', default=None)
+
+    def teardown(self, count):
+        sys.argv = self.argv
+
+    def time_parse(self, count):
+        parser = ArgumentParserWithFallback(fallback=self.cfg)
+        for alias in self.aliases:
+            parser.add_argument(f'--{alias}', default=None)
+        parser.parse_args()
+
+    def time_resolve(self, count):
+        # only the fallback resolution of a parser that was already set up
+        self.parser.__exit__(None, None, None)
+
+    def time_resolve_environ(self, count):
+        self.environ.__exit__(None, None, None)
+
+# runner #
+def benchmarks(pattern:str=None):
+    # yield (name, class, method, params) of all benchmarks in this module
+    for cls in [Lookup, IO, Format, Fork, Concurrent, FileRegistration, ArgumentParsing]:
+        for method in sorted(name for name in vars(cls) if name.startswith('time_')):
+            name = f'{cls.__name__}.{method}'
+            if pattern is None or pattern in name:
+                for params in product(*cls.params):
+                    yield name, cls, method, params
+
+def measure(cls, method:str, params:tuple, repeat:int=5) -> dict:
+    # time one benchmark: per call minimum and median over repeat runs
+    obj = cls()
+    obj.setup(*params)
+    try:
+        function = lambda: getattr(obj, method)(*params)
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        times = [time/number for time in timer.repeat(repeat=repeat, number=number)]
+    finally:
+        if hasattr(obj, 'teardown'):
+            obj.teardown(*params)
+    return {'min':min(times), 'median':statistics.median(times), 'number':number, 'repeat':repeat}
+
+def commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def run(pattern:str=None, output:Path=None, repeat:int=5) -> Path:
+    results = dict()
+    for name, cls, method, params in benchmarks(pattern):
+        key = repr(params[0] if len(params) == 1 else params)
+        result = measure(cls, method, params, repeat=repeat)
+        results.setdefault(name, dict())[key] = result
+        print(f'{name:<40} {key:<20} {result["min"]*1e6:>12.2f} us')
+
+    output = RESULTS/f'{commit()}.json' if output is None else Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as fp:
+        json.dump({
+            'commit':commit(),
+            'date':datetime.now(timezone.utc).isoformat(),
+            'python':platform.python_version(),
+            'machine':platform.machine(),
+            'results':results,
+        }, fp, indent=2)
+    print(f'saved results to {output}')
+    return output
+
+def compare(old:Path, new:Path, threshold:float=1.1) -> bool:
+    # print ratio new/old of the minimum time, returns False if any benchmark got slower than threshold
+    with open(old) as fp:
+        before = json.load(fp)
+    with open(new) as fp:
+        after = json.load(fp)
+
+    ok = True
+    print(f'{before["commit"]} -> {after["commit"]}')
+    for name, results in after['results'].items():
+        for params, result in results.items():
+            if not params in before['results'].get(name, {}):
+                continue
+            ratio = result['min']/before['results'][name][params]['min']
+            flag = '  slower' if ratio > threshold else '  faster' if ratio < 1/threshold else ''
+            ok &= ratio <= threshold
+            print(f'{name:<40} {params:<20} {ratio:>8.2f}{flag}')
+    return ok
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filter', default=None, help='only run benchmarks whose name contains this string')
+    parser.add_argument('--output', default=None, help='json file to save the results to')
+    parser.add_argument('--repeat', default=5, type=int)
+    parser.add_argument('--compare', nargs=2, default=None, metavar=('OLD', 'NEW'), help='compare two result files')
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(0 if compare(*args.compare) else 1)
+    run(args.filter, args.output, args.repeat)
@@ -0,0 +1,60 @@
+'''Benchmark expanding a base config into the run configs of a parameter sweep.
+
+Compares copying the base with a pickle round trip and overwriting the swept
+parameters of every run against Config.sweep, whose runs share the unchanged
+groups with the base. Reports the time to build every run and look up a swept
+and an unchanged alias, and the memory held by the runs. Run from the
+repository root:
+
+    python benchmarks/sweep.py
+'''
+# buildin
+from time import perf_counter
+import pickle
+import tracemalloc
+
+# package
+from trees import build_tree
+
+def copies(cfg, sweep) -> list:
+    runs = list()
+    for run in range(len(sweep)):
+        copy = pickle.loads(pickle.dumps(cfg))
+        for alias, value in sweep.overrides(run).items():
+            group = copy._handler.lookup(copy, alias)[0]
+            node = copy
+            for key in group:
+                node = node._tree[key]
+            node.add_parameter(alias, value, overwrite=True)
+        runs.append(copy)
+    return runs
+
+def sweeps(cfg, sweep) -> list:
+    return [run for _, run in sweep]
+
+def measure(build, cfg, sweep, aliases:list[str]) -> tuple[float, float]:
+    tracemalloc.start()
+    start = perf_counter()
+    runs = build(cfg, sweep)
+    for run in runs:
+        for alias in aliases:
+            getattr(run, alias)
+    elapsed = perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del runs
+    return elapsed, memory
+
+def run():
+    print(f'{"params":>7} {"runs":>5} {"copy [ms]":>14} {"[MB]":>7} {"sweep [ms]":>11} {"[MB]":>7} {"speedup":>8}')
+    for width in [10, 50]:
+        cfg = build_tree(depth=2, width=width, params=50)
+        sweep = cfg.sweep({'p0_0_0':range(10), f'p1_{width-1}_49':range(10)})
+        aliases = ['p0_0_0', f'p1_{width-1}_49', 'p0_1_1']
+
+        old, old_memory = measure(copies, cfg, sweep, aliases)
+        new, new_memory = measure(sweeps, cfg, sweep, aliases)
+        print(f'{2*width*50:>7} {len(sweep):>5} {old*1e3:>14.1f} {old_memory/1e6:>7.2f} {new*1e3:>11.1f} {new_memory/1e6:>7.2f} {old/new:>8.1f}')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,38 @@
+'''Synthetic config trees for the benchmarks.'''
+# buildin
+from pathlib import Path
+
+# package
+from configlib import Config, BaseConfig, FileConfig
+
+def build_tree(depth:int, width:int, params:int, strict:bool=False) -> Config:
+    # build a config <depth> levels deep with <width> groups per level and <params> parameters per group
+    cfg = Config(strict=strict)
+    parent = cfg
+    for d in range(depth):
+        for w in range(width):
+            group = parent.add_group(f'g{d}_{w}', BaseConfig)
+            for p in range(params):
+                group.add_parameter(f'p{d}_{w}_{p}', p)
+
+        # dive deeper through the last group of this level
+        parent = group
+    return cfg
+
+def last_alias(depth:int, width:int, params:int) -> str:
+    # deepest and last registered alias: the worst case for a depth first search
+    return f'p{depth-1}_{width-1}_{params-1}'
+
+def build_directories(root:Path, count:int) -> list[Path]:
+    # create <count> directories in root
+    paths = [Path(root)/f'dir{n}' for n in range(count)]
+    for path in paths:
+        path.mkdir(parents=True, exist_ok=True)
+    return paths
+
+def build_files(root:Path, count:int) -> FileConfig:
+    # file config with <count> existing directories
+    files = FileConfig(name='files', strict=False)
+    for n, path in enumerate(build_directories(root, count)):
+        files.add_parameter(f'dir{n}', path)
+    return files
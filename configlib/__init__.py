@@ -1,4 +1,23 @@
-from .configlib import Config, BaseConfig, FileConfig, ModelConfig
-from .configlib import ConfigIO, ConfigFormatter
-from .configlib import ArgumentParserWithFallback
-from .configlib import NameError, AliasUnavailableError, DefaultNotRegisteredError
\ No newline at end of file
+# names are imported from their submodule on first use, such that importing configlib itself is cheap
+# and e.g. argparse is only imported when the argument parser is used
+import importlib
+
+_submodules = {
+    **dict.fromkeys(['Config', 'BaseConfig', 'FileConfig', 'ModelConfig', 'ArrayConfig', 'LayeredConfig', 'ConfigSweep', 'ConcurrentConfig'], 'configlib'),
+    **dict.fromkeys(['ConfigIO', 'ConfigBackend', 'ConfigFormatter', 'ConfigWatcher', 'ConfigProfiler', 'FrozenConfig', 'SharedConfig'], 'configlib'),
+    **dict.fromkeys(['NameError', 'AliasUnavailableError', 'RegistrationError', 'DefaultNotRegisteredError'], 'configlib'),
+    'ArgumentParserWithFallback':'parser',
+}
+__all__ = list(_submodules)
+
+def __getattr__(name:str):
+    if not name in _submodules:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{_submodules[name]}', __name__), name)
+
+    # later lookups do not pass through here
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_submodules))
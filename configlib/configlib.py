@@ -2,21 +2,76 @@
 from __future__ import annotations
 
 # buildin
-from argparse import ArgumentParser, Namespace
-from pathlib import Path
-from typing import Any, Callable
-import logging
+from collections import ChainMap
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path, PurePath
+from types import MappingProxyType
+import importlib
+import math
+import os
+import re
+import struct
+import sys
+import threading
+import time
 import warnings
-
-# dependencies
-from yaml import load, dump, Loader
-
-__all__ = ['NameError', 'AliasUnavailableError', 'ConfigIO', 'ConfigFormatter', 'Config', 'BaseConfig', 'FileConfig', 'ArgumentParserWithFallback']
+import weakref
+import zlib
+
+# only used in annotations, which are not evaluated at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from multiprocessing import shared_memory
+    from typing import Any, Callable, Iterable, Iterator, TextIO
+
+# dependencies are imported on first use, such that importing configlib stays cheap for processes
+# that only use configs that were already read or cached: yaml through _yaml_, the optional
+# dependencies (orjson, msgpack, numpy, tomllib) through _optional_ and logging through _log_.
+# Modules of the standard library that only some features need are imported where they are used.
+_optional: dict[str, Any] = dict()
+
+def _optional_(*names:str) -> Any:
+    # first installed module of names, None if neither is installed
+    for name in names:
+        if not name in _optional:
+            try:
+                _optional[name] = importlib.import_module(name)
+            except ImportError:
+                _optional[name] = None
+        if not _optional[name] is None:
+            return _optional[name]
+
+def _log_(level:str, msg:str, *args:Any) -> None:
+    # log to the root logger. Until logging is imported nothing can be configured to show
+    # info messages, so those are dropped instead of importing logging for them
+    logging = sys.modules.get('logging')
+    if logging is None:
+        if level == 'info':
+            return
+        import logging
+    getattr(logging, level)(msg, *args)
+
+def _info_enabled_() -> bool:
+    # whether info messages would be shown, e.g. to skip building many messages
+    logging = sys.modules.get('logging')
+    return not logging is None and logging.getLogger().isEnabledFor(logging.INFO)
+
+class YAMLError(Exception):
+    # placeholder for yaml.YAMLError until yaml is imported by _yaml_
+    pass
+
+__all__ = ['NameError', 'AliasUnavailableError', 'RegistrationError', 'ConfigIO', 'ConfigBackend', 'ConfigFormatter', 'ConfigWatcher', 'ConfigProfiler', 'Config', 'BaseConfig', 'FileConfig', 'ArrayConfig', 'LayeredConfig', 'ConfigSweep', 'ConcurrentConfig', 'FrozenConfig', 'SharedConfig', 'ArgumentParserWithFallback']
 
 # Global default path 
 DEFAULT_PATH_TO_CONFIG = Path.cwd()/'config.yml'
 WARNING_STACK_LVL = 3
 
+# header of the compiled snapshot files, bump when the layout changes
+CACHE_MAGIC = b'configlib-cache-2\n'
+
 class NameError(Exception):
     def __init__(self, *args: object) -> None:
         msg = 'Unsupported Variable name. Varialbe cannot be private (_), private protected (__), dunder, sunder or overwrite a class function'
@@ -28,12 +83,392 @@ class AliasUnavailableError(Exception):
         super().__init__(msg, *args)
 
 class DefaultNotRegisteredError(Exception):
-    def __init__(self, arg:str, *args: object) -> None:
-        msg = f'No default argument for <{arg}> in the fallback config, please register a default value in the fallback config.'
+    def __init__(self, arg:str | list[str], *args: object) -> None:
+        # the parser reports every unresolved argument at once
+        self.arguments = [arg] if isinstance(arg, str) else list(arg)
+        names = ', '.join(f'<{arg}>' for arg in self.arguments)
+        msg = f'No default argument for {names} in the fallback config, please register a default value in the fallback config.'
         super().__init__(msg, *args)
 
 
+class RegistrationError(NameError, AliasUnavailableError):
+    def __init__(self, banned:list[str], registered:list[str], *args: object) -> None:
+        # bulk registration reports all conflicting aliases at once
+        self.banned = banned
+        self.registered = registered
+        msg = f'{len(banned)+len(registered)} aliases could not be registered. Banned or private names: {banned}. Already registered: {registered}.'
+        Exception.__init__(self, msg, *args)
+
+
+class ConfigBackend:
+    """Serialisation format of ConfigIO, registered by name and file extension with ConfigIO.add_backend.
+
+    Subclasses implement dumps and loads of a tree. Formats without tags represent the config
+    objects as mappings with a __config__ key, see encode and decode. Formats that can be written
+    entry by entry set fragments, such that ConfigIO.writeto can reuse the serialised groups that
+    did not change.
+    """
+    name: str = None
+    extensions: tuple[str, ...] = ()
+
+    # raised by loads for data that is not a complete document, e.g. a file saved halfway. The decode
+    # errors of json, orjson, tomllib and msgpack are all ValueErrors
+    errors: tuple[type[Exception], ...] = (ValueError,)
+
+    # written as start + fragment + separator + fragment + ... + end
+    fragments: bool = False
+    start: bytes = b''
+    separator: bytes = b''
+    end: bytes = b''
+
+    def dumps(self, tree:dict) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data:bytes) -> dict:
+        raise NotImplementedError
+
+    def fragment(self, alias:str, value:Any) -> bytes:
+        # serialised top level entry, only used when fragments is set
+        raise NotImplementedError
+
+    def dump(self, tree:dict, fp, reuse:bool=False) -> None:
+        # write tree to binary file object fp
+        if not (self.fragments and tree):
+            fp.write(self.dumps(tree))
+            return
+        
+        fp.write(self.start)
+        for n, (alias, value) in enumerate(tree.items()):
+            if n:
+                fp.write(self.separator)
+            fp.write(ConfigIO.__fragment__(self, alias, value, reuse))
+        fp.write(self.end)
+
+    @classmethod
+    def encode(cls, value:Any) -> Any:
+        # plain representation of the config objects and paths
+        if isinstance(value, (Config, BaseConfig)):
+            data = {'__config__':ConfigIO.__tagof__(value), '__name__':value._name, '__strict__':value._strict}
+            # aliases cannot be dunder, so they never collide with the keys above
+            data.update((alias, cls.encode(child)) for alias, child in value._tree.items())
+            return data
+        if isinstance(value, PurePath):
+            return {'__path__':str(value)}
+        if 'numpy' in sys.modules and isinstance(value, sys.modules['numpy'].ndarray):
+            # arrays only exist once numpy is imported, 0-d arrays of numbers are written inline
+            if ConfigIO.__inline__(value):
+                return cls.encode(value.item())
+            return {'__array__':ConfigIO.__savearray__(value)}
+        if isinstance(value, dict):
+            return {key:cls.encode(child) for key, child in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls.encode(child) for child in value]
+        return cls._scalar_(value)
+
+    @staticmethod
+    def _scalar_(value:Any) -> Any:
+        # hook for values the format cannot represent: {'__none__': True} for None, {'__float__': 'inf'} for floats
+        return value
+
+    @classmethod
+    def decode(cls, value:Any) -> Any:
+        # inverse of encode
+        if isinstance(value, dict):
+            if '__config__' in value:
+                configClass = ConfigIO.__classof__(value['__config__'])
+                tree = {alias:cls.decode(child) for alias, child in value.items() if not alias in ('__config__', '__name__', '__strict__')}
+                return configClass._from_state_(value['__name__'], value['__strict__'], tree)
+            if len(value) == 1 and '__path__' in value:
+                return Path(value['__path__'])
+            if len(value) == 1 and '__array__' in value:
+                return ConfigIO.__loadarray__(value['__array__'])
+            if len(value) == 1 and '__none__' in value:
+                return None
+            if len(value) == 1 and '__float__' in value:
+                return float(value['__float__'])
+            return {key:cls.decode(child) for key, child in value.items()}
+        if isinstance(value, list):
+            return [cls.decode(child) for child in value]
+        return value
+
+class YAMLBackend(ConfigBackend):
+    # tagged YAML, see ConfigLoader and ConfigDumper
+    name = 'yaml'
+    extensions = ('.yml', '.yaml')
+    fragments = True
+
+    def dumps(self, tree:dict) -> bytes:
+        _yaml_()
+        return dump(tree, Dumper=ConfigDumper, sort_keys=False).encode()
+
+    def loads(self, data:bytes) -> dict:
+        _yaml_()
+        return load(data, ConfigLoader)
+
+    def fragment(self, alias:str, value:Any) -> bytes:
+        _yaml_()
+        return dump({alias:value}, Dumper=ConfigDumper, sort_keys=False).encode()
+
+class JSONBackend(ConfigBackend):
+    # uses orjson when it is installed
+    name = 'json'
+    extensions = ('.json',)
+    fragments = True
+    start = b'{\n'
+    separator = b',\n'
+    end = b'\n}\n'
+
+    @staticmethod
+    def _scalar_(value:Any) -> Any:
+        # inf and nan are not part of json
+        if isinstance(value, float) and not math.isfinite(value):
+            return {'__float__':repr(value)}
+        return value
+
+    @staticmethod
+    def _dumps_(value:Any) -> bytes:
+        orjson = _optional_('orjson')
+        if not orjson is None:
+            try:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # e.g. integers over 64 bit, let json decide
+                pass
+        import json
+        return json.dumps(value, ensure_ascii=False).encode()
+
+    def dumps(self, tree:dict) -> bytes:
+        return self._dumps_(self.encode(tree)) + b'\n'
+
+    def loads(self, data:bytes) -> dict:
+        orjson = _optional_('orjson')
+        if orjson is None:
+            import json
+            return self.decode(json.loads(data))
+        return self.decode(orjson.loads(data))
+
+    def fragment(self, alias:str, value:Any) -> bytes:
+        return self._dumps_(str(alias)) + b': ' + self._dumps_(self.encode(value))
+
+class TOMLBackend(ConfigBackend):
+    # read with tomllib, written by a minimal writer: every config object is a table, the rest inline
+    name = 'toml'
+    extensions = ('.toml',)
+    _bare = re.compile(r'[A-Za-z0-9_-]+')
+
+    def dumps(self, tree:dict) -> bytes:
+        return '\n'.join(self._table_((), self.encode(tree))).lstrip().encode() + b'\n'
+
+    @staticmethod
+    def _scalar_(value:Any) -> Any:
+        return {'__none__':True} if value is None else value
+
+    def loads(self, data:bytes) -> dict:
+        tomllib = _optional_('tomllib', 'tomli')
+        if tomllib is None:
+            raise ImportError('reading TOML requires python >= 3.11 or the tomli package')
+        return self.decode(tomllib.loads(data.decode()))
+
+    @classmethod
+    def decode(cls, value:Any) -> Any:
+        # restore the order of the entries of a config object that has parameters after a subgroup
+        if isinstance(value, dict) and '__config__' in value and '__order__' in value:
+            order = value.pop('__order__')
+            value = {key:value[key] for key in value if key[:2] == '__'} | {key:value[key] for key in order}
+        return super().decode(value)
+
+    @classmethod
+    def _table_(cls, path:tuple[str, ...], table:dict) -> list[str]:
+        # key value pairs of a table come before its sub tables. The order defines the dot search, so
+        # if that changes it, the order of the entries is written to __order__
+        lines = [f'[{".".join(map(cls._key_, path))}]'] if path else []
+        tables = [key for key, value in table.items() if isinstance(value, dict) and '__config__' in value]
+        entries = [key for key in table if key[:2] != '__']
+        if '__config__' in table and entries != [key for key in entries if not key in tables] + tables:
+            table = table | {'__order__':entries}
+        lines += [f'{cls._key_(key)} = {cls._value_(value)}' for key, value in table.items() if not key in tables]
+        for key in tables:
+            lines += ['', *cls._table_(path + (key,), table[key])]
+        return lines
+
+    @classmethod
+    def _key_(cls, key:Any) -> str:
+        key = str(key)
+        return key if cls._bare.fullmatch(key) else cls._value_(key)
+
+    @classmethod
+    def _value_(cls, value:Any) -> str:
+        if isinstance(value, str):
+            import json
+            return json.dumps(value, ensure_ascii=False).replace('\x7f', '\\u007f')
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float):
+            if math.isnan(value):
+                return 'nan'
+            if math.isinf(value):
+                return 'inf' if value > 0 else '-inf'
+            return repr(value)
+        # dates only exist once datetime is imported
+        datetime = sys.modules.get('datetime')
+        if not datetime is None and isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, list):
+            return '[' + ', '.join(map(cls._value_, value)) + ']'
+        if isinstance(value, dict):
+            return '{' + ', '.join(f'{cls._key_(key)} = {cls._value_(child)}' for key, child in value.items()) + '}'
+        raise TypeError(f'cannot represent {type(value).__name__} in TOML')
+
+class MsgpackBackend(ConfigBackend):
+    # binary format for configs exchanged between machines. Uses the msgpack package when it is
+    # installed and an equivalent pure python codec of the same wire format otherwise.
+    name = 'msgpack'
+    extensions = ('.msgpack', '.mpk')
+    # the pure python codec runs out of data on truncated documents
+    errors = (ValueError, IndexError, struct.error)
+
+    def dumps(self, tree:dict) -> bytes:
+        value = self.encode(tree)
+        msgpack = _optional_('msgpack')
+        if not msgpack is None:
+            return msgpack.packb(value, use_bin_type=True)
+        out = bytearray()
+        self._pack_(value, out)
+        return bytes(out)
+
+    def loads(self, data:bytes) -> dict:
+        msgpack = _optional_('msgpack')
+        if not msgpack is None:
+            return self.decode(msgpack.unpackb(data, raw=False, strict_map_key=False))
+        value, end = self._unpack_(memoryview(data), 0)
+        if end != len(data):
+            raise ValueError(f'{len(data)-end} bytes of trailing data after msgpack document')
+        return self.decode(value)
+
+    @classmethod
+    def _header_(cls, out:bytearray, size:int, fix:int | None, fixmax:int, codes:tuple[int, int, int]) -> None:
+        # size prefix: fix type, 8 (or 16 for containers), 16 and 32 bit length
+        if not fix is None and size <= fixmax:
+            out.append(fix | size)
+        elif not codes[0] is None and size <= 0xff:
+            out += struct.pack('>BB', codes[0], size)
+        elif size <= 0xffff:
+            out += struct.pack('>BH', codes[1], size)
+        else:
+            out += struct.pack('>BI', codes[2], size)
+
+    @classmethod
+    def _pack_(cls, value:Any, out:bytearray) -> None:
+        if value is None:
+            out.append(0xc0)
+        elif value is True or value is False:
+            out.append(0xc3 if value else 0xc2)
+        elif isinstance(value, int):
+            if 0 <= value <= 0x7f or -32 <= value < 0:
+                out += struct.pack('>b' if value < 0 else '>B', value)
+            elif 0 < value <= 0xffffffffffffffff:
+                for code, fmt in ((0xcc, '>B'), (0xcd, '>H'), (0xce, '>I'), (0xcf, '>Q')):
+                    if value < 1 << 8*struct.calcsize(fmt):
+                        out += struct.pack('>B', code) + struct.pack(fmt, value)
+                        break
+            elif -1 << 63 <= value < 0:
+                for code, fmt in ((0xd0, '>b'), (0xd1, '>h'), (0xd2, '>i'), (0xd3, '>q')):
+                    if value >= -1 << 8*struct.calcsize(fmt)-1:
+                        out += struct.pack('>B', code) + struct.pack(fmt, value)
+                        break
+            else:
+                raise OverflowError(f'integer {value} does not fit in 64 bit')
+        elif isinstance(value, float):
+            out += struct.pack('>Bd', 0xcb, value)
+        elif isinstance(value, str):
+            data = value.encode()
+            cls._header_(out, len(data), 0xa0, 31, (0xd9, 0xda, 0xdb))
+            out += data
+        elif isinstance(value, (bytes, bytearray)):
+            cls._header_(out, len(value), None, -1, (0xc4, 0xc5, 0xc6))
+            out += value
+        elif isinstance(value, (list, tuple)):
+            cls._header_(out, len(value), 0x90, 15, (None, 0xdc, 0xdd))
+            for child in value:
+                cls._pack_(child, out)
+        elif isinstance(value, dict):
+            cls._header_(out, len(value), 0x80, 15, (None, 0xde, 0xdf))
+            for key, child in value.items():
+                cls._pack_(key, out)
+                cls._pack_(child, out)
+        else:
+            raise TypeError(f'cannot represent {type(value).__name__} in msgpack')
+
+    # type code: (struct format of the value or length, kind)
+    _codes = {
+        0xc4:('>B', 'bin'), 0xc5:('>H', 'bin'), 0xc6:('>I', 'bin'), 0xca:('>f', 'value'), 0xcb:('>d', 'value'),
+        0xcc:('>B', 'value'), 0xcd:('>H', 'value'), 0xce:('>I', 'value'), 0xcf:('>Q', 'value'),
+        0xd0:('>b', 'value'), 0xd1:('>h', 'value'), 0xd2:('>i', 'value'), 0xd3:('>q', 'value'),
+        0xd9:('>B', 'str'), 0xda:('>H', 'str'), 0xdb:('>I', 'str'),
+        0xdc:('>H', 'array'), 0xdd:('>I', 'array'), 0xde:('>H', 'map'), 0xdf:('>I', 'map'),
+    }
+
+    @classmethod
+    def _unpack_(cls, data:memoryview, pos:int) -> tuple[Any, int]:
+        # return value starting at pos and the position after it
+        code = data[pos]
+        pos += 1
+        if code <= 0x7f:
+            return code, pos
+        if code >= 0xe0:
+            return code - 0x100, pos
+        if code <= 0x8f:
+            kind, size = 'map', code & 0x0f
+        elif code <= 0x9f:
+            kind, size = 'array', code & 0x0f
+        elif code <= 0xbf:
+            kind, size = 'str', code & 0x1f
+        elif code in (0xc0, 0xc2, 0xc3):
+            return {0xc0:None, 0xc2:False, 0xc3:True}[code], pos
+        elif code in cls._codes:
+            fmt, kind = cls._codes[code]
+            size, = struct.unpack_from(fmt, data, pos)
+            pos += struct.calcsize(fmt)
+            if kind == 'value':
+                return size, pos
+        else:
+            raise ValueError(f'unsupported msgpack type 0x{code:02x} at byte {pos-1}')
+
+        if kind == 'str':
+            return str(data[pos:pos+size], 'utf-8'), pos+size
+        if kind == 'bin':
+            return bytes(data[pos:pos+size]), pos+size
+        if kind == 'array':
+            value = []
+            for _ in range(size):
+                child, pos = cls._unpack_(data, pos)
+                value.append(child)
+            return value, pos
+        value = {}
+        for _ in range(size):
+            key, pos = cls._unpack_(data, pos)
+            value[key], pos = cls._unpack_(data, pos)
+        return value, pos
+
 class ConfigIO:
+    # opt-in compiled snapshot cache for readfrom: a pickled copy of the parsed tree, keyed on path, mtime,
+    # size and content hash. Snapshots are only kept in a directory that belongs to the user, by default
+    # $XDG_CACHE_HOME/configlib, as loading a pickle written by someone else could run arbitrary code.
+    cache: bool = False
+    cachedir: Path | None = None
+
+    # serialisation formats by name and file extension, see add_backend
+    backends: dict[str, ConfigBackend] = dict()
+    default_backend: str = 'yaml'
+
+    # config classes by tag name and vice versa, see add_config_class
+    _classes: dict[str, type] = dict()
+    _tags: dict[type, str] = dict()
+
+    # file that is being read or written by this thread, for the array sidecars
+    _local = threading.local()
 
     @staticmethod
     def __default_checks__(fpath:Path):
@@ -50,33 +485,224 @@ class ConfigIO:
         return fpath
     
     @classmethod
-    def writeto(cls, config:Config, fpath:Path=None) -> None:
+    def add_backend(cls, backend:ConfigBackend) -> None:
+        # register a serialisation format under its name and file extensions
+        cls.backends[backend.name] = backend
+        for extension in backend.extensions:
+            cls.backends[extension] = backend
+
+    @classmethod
+    def backend(cls, fpath:Path=None, backend:str | ConfigBackend=None) -> ConfigBackend:
+        # explicit backend (name, extension or instance) first, otherwise by file extension, otherwise the default
+        if isinstance(backend, ConfigBackend):
+            return backend
+        if not backend is None:
+            try:
+                return cls.backends[backend]
+            except KeyError:
+                raise ValueError(f'unknown config backend {backend!r}, available are {sorted(key for key in cls.backends if not key.startswith("."))}') from None
+        if not fpath is None and fpath.suffix.lower() in cls.backends:
+            return cls.backends[fpath.suffix.lower()]
+        return cls.backends[cls.default_backend]
+
+    @classmethod
+    def writeto(cls, config:Config, fpath:Path=None, fsync:bool=False, reuse:bool=False, backend:str | ConfigBackend=None) -> None:
 
         # do standard checks
         fpath = cls.__default_checks__(fpath)
+        backend = cls.backend(fpath, backend)
+
+        # if file extension of the format not in path -> add
+        if not fpath.suffix.lower() in backend.extensions:
+            fpath = Path(str(fpath)+backend.extensions[0])
+
+        # replace the file a link points to, not the link itself
+        if fpath.is_symlink():
+            fpath = fpath.resolve()
+
+        # stream group by group into a temporary file next to the destination and move it in place
+        # once complete, such that a crash never leaves a truncated config behind
+        tmppath = fpath.parent/f'.{fpath.name}.{os.getpid()}-{threading.get_ident()}.tmp'
+        fd = os.open(tmppath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as fp, cls.__sidecars__(fpath, fsync):
+
+                # write to disk, keep registration order as it defines the dot search order
+                backend.dump(config._tree if type(config._tree) is dict else dict(config._tree.items()), fp, reuse)
+
+                if fsync:
+                    fp.flush()
+                    os.fsync(fp.fileno())
+
+            # keep the permissions of the file that is replaced
+            if fpath.exists():
+                os.chmod(tmppath, os.stat(fpath).st_mode & 0o7777)
+            os.replace(tmppath, fpath)
+        except BaseException:
+            if tmppath.exists():
+                os.remove(tmppath)
+            raise
+
+        # make the rename itself durable
+        if fsync:
+            cls.__fsyncdir__(fpath.parent)
+
+    @classmethod
+    def __fragment__(cls, backend:ConfigBackend, alias:str, value:Any, reuse:bool=False) -> bytes:
+        # serialised single top level entry. The fragment of a group is kept by its handler
+        # until the group or any group below it changes, see ConfigHandler.touch
+        if not isinstance(value, BaseConfig):
+            return backend.fragment(alias, value)
+
+        # fragments refer to array sidecars relative to the file they were written to
+        key = (backend.name, alias, getattr(cls._local, 'fpath', None))
+        handler = value._handler
+        if reuse and not handler._fragment is None and handler._fragment[:3] == key:
+            return handler._fragment[-1]
+
+        # index the group, such that changes to its subgroups are pushed up to it
+        handler.index(value)
+        data = backend.fragment(alias, value)
+        handler._fragment = (*key, data)
+        return data
+
+    # array sidecars #
+    # numpy arrays are not written into the config file itself but into content addressed .npy files in
+    # a directory next to it (<stem>.arrays), which the config file refers to. They are read memory mapped.
+    # 0-d arrays of numbers are written inline instead, as the number they hold.
+    @classmethod
+    @contextmanager
+    def __sidecars__(cls, fpath:Path | None, fsync:bool=False):
+        # set the file arrays are resolved against while reading or writing in this thread,
+        # arrays collects the sidecars that were read
+        previous = getattr(cls._local, 'fpath', None), getattr(cls._local, 'fsync', False)
+        cls._local.fpath, cls._local.fsync, cls._local.arrays = fpath, fsync, set()
+        try:
+            yield cls._local
+        finally:
+            cls._local.fpath, cls._local.fsync = previous
 
-        # if yaml file extension not in path -> add
-        if not (str(fpath).endswith('.yml') or str(fpath).endswith('.yaml')):
-            fpath = Path(str(fpath)+'.yml')
+    @staticmethod
+    def __inline__(array:Any) -> bool:
+        # 0-d arrays of booleans, integers and floats are written as python values
+        return array.ndim == 0 and array.dtype.kind in 'biuf'
+
+    @classmethod
+    def prune(cls, fpath:Path=None) -> list[Path]:
+        # remove the array sidecars of fpath that are no longer referenced, e.g. of arrays that were replaced.
+        # The config files of every format with the same stem share the sidecars, all of them are read
+        fpath = cls.__default_checks__(fpath)
+        directory = fpath.parent/f'{fpath.stem}.arrays'
+        if not directory.is_dir():
+            return []
+
+        referenced = set()
+        for extension in {key for key in cls.backends if key.startswith('.')}:
+            path = fpath.with_suffix(extension)
+            if path.exists():
+                with cls.__sidecars__(path) as context:
+                    cls.backend(path).loads(path.read_bytes())
+                referenced |= {Path(relpath).name for relpath in context.arrays}
+
+        # readers that have a removed sidecar memory mapped keep their copy
+        removed = list()
+        for path in directory.glob('*.npy'):
+            if not path.name in referenced:
+                path.unlink()
+                removed.append(path)
+        return removed
+
+    @classmethod
+    def __savearray__(cls, array:Any) -> str:
+        # write array to its sidecar, if not there already, and return the path relative to the config file
+        fpath = getattr(cls._local, 'fpath', None)
+        if fpath is None:
+            raise ValueError('arrays can only be written to a file through ConfigIO.writeto')
+
+        import hashlib
+        numpy = _optional_('numpy')
+        array = numpy.require(array, requirements='C')
+        digest = hashlib.blake2b(repr((array.dtype.descr, array.shape)).encode(), digest_size=16)
+        digest.update(array.reshape(-1).view(numpy.uint8))
+
+        directory = fpath.parent/f'{fpath.stem}.arrays'
+        path = directory/f'{digest.hexdigest()}.npy'
+        if not path.exists():
+            # readers may have the previous file memory mapped, so replace rather than overwrite
+            directory.mkdir(exist_ok=True)
+            import tempfile
+            fd, tmppath = tempfile.mkstemp(dir=directory, prefix=path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    numpy.save(fp, array, allow_pickle=False)
+                    if cls._local.fsync:
+                        fp.flush()
+                        os.fsync(fp.fileno())
+                os.replace(tmppath, path)
+            except BaseException:
+                os.remove(tmppath)
+                raise
+        return f'{directory.name}/{path.name}'
+
+    @classmethod
+    def __loadarray__(cls, relpath:str) -> Any:
+        numpy = _optional_('numpy')
+        if numpy is None:
+            raise ImportError(f'reading array {relpath} requires numpy, install it with pip install numpy')
+        fpath = getattr(cls._local, 'fpath', None)
+        path = Path(relpath) if fpath is None else fpath.parent/relpath
 
-        todump = config._tree
-        # save to disk in str format (! not bytes)
-        with open(fpath,'w') as fp:
+        # trees with arrays are not cached, as the snapshot would neither see changes to the sidecars nor map them
+        getattr(cls._local, 'arrays', set()).add(relpath)
+        return numpy.load(path, mmap_mode='r', allow_pickle=False)
 
-            # write to disk
-            dump(todump, fp)
+    @staticmethod
+    def __fsyncdir__(dirpath:Path) -> None:
+        try:
+            fd = os.open(dirpath, os.O_RDONLY)
+        except OSError:
+            # e.g. on windows directories cannot be opened
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
     @classmethod
-    def readfrom(cls, configClass:Config, fpath:Path=None) -> Config:
+    def readfrom(cls, configClass:Config, fpath:Path=None, cache:bool=None, lazy:bool=False, backend:str | ConfigBackend=None) -> Config:
 
          # do standard checks
         fpath = cls.__default_checks__(fpath)
+        backend = cls.backend(fpath, backend)
 
-        # open read only
-        with open(fpath,'r') as fp:
+        # lazy mode: only index the top level groups, they are constructed on first access
+        # only YAML files can be split, other formats are read in full
+        if lazy and isinstance(backend, YAMLBackend):
+            groups = LazyTree.scan(fpath)
 
-            # read tree from disk
-            loaded = load(fp, Loader)
+            # files that cannot be split safely are read in full
+            if not groups is None:
+                state = groups.get('general')
+                obj = configClass(name=state._name, strict=state._strict)
+
+                # same dot search order as reading in full, where the root group exists before the tree is set
+                groups.lead(state._name)
+
+                # replace tree by lazy index until it is materialised
+                del obj._tree
+                obj._lazy = groups
+                obj._handler.touch(obj)
+                obj._handler._initialised=True
+
+                # reload re-reads the same file by default
+                obj._source = (fpath, backend)
+
+                return obj
+
+        # read tree from disk
+        loaded = cls.readtree(fpath, cache=cache, backend=backend)
         
         # Initialse config object and set tree
         state = loaded.get('general')
@@ -84,41 +710,407 @@ class ConfigIO:
         obj.settree(loaded)
         obj._handler._initialised=True
 
+        # reload re-reads the same file by default
+        obj._source = (fpath, backend)
+
         # return initialised Config object
         return obj
 
-class ConfigFormatter:
     @classmethod
-    def format(cls, config: BaseConfig):
-        # initialise buffer
-        printable = list()
+    def readtree(cls, fpath:Path=None, cache:bool=None, backend:str | ConfigBackend=None) -> dict:
+        # read the tree of a config file without initialising a Config object
+
+        # do standard checks
+        fpath = cls.__default_checks__(fpath)
+        backend = cls.backend(fpath, backend)
+
+        # default to class wide setting
+        if cache is None:
+            cache = cls.cache
+
+        # open read only, stat the open file such that the key matches the content
+        with open(fpath,'rb') as fp:
+            stat = os.fstat(fp.fileno())
+            data = fp.read()
+
+        loaded = None
+        cachepath = cls.__cachepath__(fpath) if cache else None
+        if not cachepath is None:
+            # try the compiled snapshot first
+            import hashlib
+            key = repr((str(fpath.resolve()), stat.st_mtime_ns, stat.st_size, hashlib.blake2b(data).hexdigest())).encode()
+            loaded = cls.__readcache__(cachepath, key)
+
+        if loaded is None:
+            # read tree from disk
+            with cls.__sidecars__(fpath) as context:
+                loaded = backend.loads(data)
+
+            # and store snapshot for the next reader
+            if not (cachepath is None or context.arrays):
+                cls.__writecache__(cachepath, key, loaded)
+
+        return loaded
+
+    # asyncio #
+    # the blocking file access and parsing run in an executor, by default the thread pool of the
+    # event loop. Pass a ProcessPoolExecutor to parse large files in parallel.
+    @classmethod
+    async def areadfrom(cls, configClass:Config, fpath:Path=None, cache:bool=None, lazy:bool=False, backend:str | ConfigBackend=None, executor:Executor=None) -> Config:
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(cls.readfrom, configClass, fpath, cache=cache, lazy=lazy, backend=backend))
+
+    @classmethod
+    async def awriteto(cls, config:Config, fpath:Path=None, fsync:bool=False, reuse:bool=False, backend:str | ConfigBackend=None, executor:Executor=None) -> None:
+        # config should not be changed until the write completed
+        import asyncio
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, partial(cls.writeto, config, fpath, fsync=fsync, reuse=reuse, backend=backend))
+
+    @classmethod
+    async def read_many(cls, configClass:Config, fpaths:list[Path], limit:int=8, cache:bool=None, backend:str | ConfigBackend=None, executor:Executor=None) -> list[Config | Exception]:
+        # read files concurrently, at most limit at a time. Returns the configs in the order of fpaths,
+        # a file that could not be read gives its exception in place of the config
+        import asyncio
+        semaphore = asyncio.Semaphore(limit)
+
+        async def read(fpath:Path) -> Config | Exception:
+            async with semaphore:
+                try:
+                    return await cls.areadfrom(configClass, fpath, cache=cache, backend=backend, executor=executor)
+                except Exception as error:
+                    _log_('info', 'could not read config %s: %r', fpath, error)
+                    return error
+
+        return await asyncio.gather(*(read(fpath) for fpath in fpaths))
+
+    @classmethod
+    def __cachepath__(cls, fpath:Path) -> Path | None:
+        # snapshot in the cache directory, prefixed by the hash of the full path to avoid collisions.
+        # None if the directory cannot be used
+        cachedir = cls.cachedir
+        if cachedir is None:
+            cachedir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home()/'.cache')/'configlib'
+        cachedir = Path(cachedir)
+
+        try:
+            cachedir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            owned = cls.__owned__(os.stat(cachedir))
+        except OSError as error:
+            _log_('info', 'could not create config cache directory %s: %r', cachedir, error)
+            return None
+        if not owned:
+            _log_('warning', 'config cache directory %s is not owned by the user or writable by others, snapshots are not used', cachedir)
+            return None
+
+        import hashlib
+        prefix = hashlib.blake2b(str(fpath.resolve()).encode(), digest_size=8).hexdigest()
+        return cachedir/f'{prefix}-{fpath.name}.cache'
+
+    @staticmethod
+    def __owned__(stat:os.stat_result) -> bool:
+        # owned by the user and not writable by group or others
+        if hasattr(os, 'getuid') and stat.st_uid != os.getuid():
+            return False
+        return not stat.st_mode & 0o022
+
+    @classmethod
+    def __readcache__(cls, cachepath:Path, key:bytes) -> dict | None:
+        # return the cached tree if the snapshot exists, belongs to the user and matches key, None otherwise
+        import pickle
+        try:
+            with open(cachepath, 'rb') as fp:
+                if not cls.__owned__(os.fstat(fp.fileno())):
+                    _log_('warning', 'ignored config cache %s that is not owned by the user or writable by others', cachepath)
+                    return None
+
+                # the key is compared before anything is unpickled
+                header = fp.read(len(CACHE_MAGIC) + 4)
+                if header[:len(CACHE_MAGIC)] != CACHE_MAGIC or fp.read(struct.unpack('<I', header[len(CACHE_MAGIC):])[0]) != key:
+                    # stale or from an other version
+                    return None
+                return pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            # corrupt snapshots are treated as a miss and will be overwritten
+            _log_('info', 'ignored unreadable config cache %s: %r', cachepath, error)
+            return None
+
+    @staticmethod
+    def __writecache__(cachepath:Path, key:bytes, loaded:dict) -> None:
+        # write snapshot to a temporary file and atomically move it in place, such that
+        # concurrent readers and writers only ever see complete snapshots
+        import pickle, tempfile
+        tmppath = None
+        try:
+            cachepath.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmppath = tempfile.mkstemp(dir=cachepath.parent, prefix=cachepath.name, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(CACHE_MAGIC + struct.pack('<I', len(key)) + key)
+                pickle.dump(loaded, fp, protocol=5)
+            os.replace(tmppath, cachepath)
+        except (OSError, pickle.PicklingError) as error:
+            # the cache is an optimisation only, never fail the read
+            _log_('info', 'could not write config cache %s: %r', cachepath, error)
+            if not tmppath is None and os.path.exists(tmppath):
+                os.remove(tmppath)
 
-        # table definition
-        elbow = "└──"
-        pipe  = "|  "
-        tee   = "├──"
-        blank = "   "
+    @classmethod
+    def __tagof__(cls, config:Config | BaseConfig) -> str:
+        # tag name of a config object in the formats without tags
+        try:
+            return cls._tags[type(config)]
+        except KeyError:
+            raise TypeError(f'{type(config).__name__} is not registered, please register it with ConfigIO.add_config_class') from None
 
-        printable.append('::'+str(type(config))+' @ '+"<{}>".format(hex(id(config)))+ f': name "{config._name}"'+ '::')
-        def get_tree(_config, level=0, header=''):
-            # function that generates a config tree string
-            # get keys and associated names
-            children = list(_config._tree.values())
-            values   = list(_config._tree.keys())
+    @classmethod
+    def __classof__(cls, tag:str) -> type:
+        try:
+            return cls._classes[tag]
+        except KeyError:
+            raise TypeError(f'unknown config class {tag}, please register it with ConfigIO.add_config_class') from None
+
+    @classmethod
+    def add_config_class(cls, configClass:Any, tag:str=None) -> None:
+        # register a (user defined) config class with the YAML loader and dumper and the other
+        # backends, such that it can be written and read using the safe YAML standard
+        if tag is None:
+            tag = '!'+configClass.__name__
+        cls._classes[tag[1:]] = configClass
+        cls._tags[configClass] = tag[1:]
+
+        # otherwise registered when yaml is set up
+        if 'ConfigLoader' in globals():
+            _add_yaml_class_(configClass, tag)
+
+class ConfigWatcher:
+    'Background thread that reloads a config whenever the modification time or size of its file changes.'
+    def __init__(self, config:Config, fpath:Path=None, interval:float=1.0, callback:Callable=None):
+        self._config = config
+        self._fpath, self._backend = config._source_(fpath)
+        self._interval = interval
+        self._callbacks = list() if callback is None else [callback]
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run_, name=f'configlib-watcher-{self._fpath.name}', daemon=True)
+        self._signature = self._stat_()
+
+    def _stat_(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self._fpath)
+        except FileNotFoundError:
+            # e.g. in the middle of an editor replacing the file
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def add_callback(self, callback:Callable) -> None:
+        # callback(config, changed) is called from the watcher thread after every reload that changed something
+        self._callbacks.append(callback)
+
+    def check(self) -> set[str]:
+        # reload if the file changed since the last check, return changed aliases
+        signature = self._stat_()
+        if signature is None or signature == self._signature:
+            return set()
+        self._signature = signature
+
+        try:
+            changed = self._config.reload(self._fpath, backend=self._backend)
+        except (OSError, YAMLError, *ConfigIO.backend(self._fpath, self._backend).errors) as error:
+            # keep serving the current config, e.g. when the file is saved halfway through an edit
+            _log_('warning', 'could not reload %s, keeping current config: %r', self._fpath, error)
+            return set()
         
-            # recursive tree generator
-            for level, (child, value) in enumerate(zip(children, values)):
-                last = level == len(children)-1
-                printable.append(header + (elbow if last else tee) + (str(value)+": "+repr(child))*(repr(child)!=value) + (str(value)+':')*(repr(child)==value))
-                if hasattr(child,'_tree'):
-                    get_tree(child, level=level, header = header + (blank if last else pipe))
+        if changed:
+            for callback in self._callbacks:
+                callback(self._config, changed)
+        return changed
+
+    def _run_(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self.check()
+            except Exception:
+                # never let a failing callback kill the watcher
+                _log_('exception', 'error while reloading %s', self._fpath)
+    
+    def start(self) -> ConfigWatcher:
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive() and not self._thread is threading.current_thread():
+            self._thread.join()
+    
+    def __enter__(self) -> ConfigWatcher:
+        return self
+    
+    def __exit__(self, *args):
+        self.stop()
 
-        # get tree
-        get_tree(config)
+class LazyTree:
+    'Index of the top level entries of a YAML config file, every entry is only constructed on first access.'
+    # a top level entry starts at every line that does not start with whitespace or a comment
+    _toplevel = re.compile(rb'^[^\s#]', re.M)
+    _keyline  = re.compile(rb'(\w[\w.-]*):(?=\s)')
 
-        # return string object
-        return '\n'.join(printable)
+    def __init__(self, data:bytes, offsets:dict[str, tuple[int, int]], fpath:Path=None):
+        self._data = data
+        self._offsets = offsets
+        self._loaded = dict()
+        # array sidecars are resolved relative to the file
+        self._fpath = fpath
+
+    @classmethod
+    def scan(cls, fpath:Path) -> LazyTree | None:
+        # index byte offsets of the top level entries of a block mapping.
+        # returns None for documents that cannot be split safely (flow style, directives, multiple documents, ...)
+        with open(fpath, 'rb') as fp:
+            data = fp.read()
+
+        starts = dict()
+        for match in cls._toplevel.finditer(data):
+            key = cls._keyline.match(data, match.start())
+            if key is None or key.group(1).decode() in starts:
+                return None
+            starts[key.group(1).decode()] = match.start()
         
+        if starts == {}:
+            return None
+        
+        bounds = list(starts.values()) + [len(data)]
+        return cls(data, {alias:(bounds[i], bounds[i+1]) for i, alias in enumerate(starts)}, fpath)
+    
+    def __contains__(self, alias:str) -> bool:
+        return alias in self._offsets
+
+    def lead(self, alias:str) -> None:
+        # move alias to the front, the order of the entries is the order of the dot search
+        if alias in self._offsets:
+            self._offsets = {alias:self._offsets[alias]} | self._offsets
+    
+    def __iter__(self):
+        return iter(self._offsets)
+    
+    def get(self, alias:str) -> Any:
+        # construct entry on first access
+        if not alias in self._loaded:
+            start, end = self._offsets[alias]
+            try:
+                with ConfigIO.__sidecars__(self._fpath):
+                    _yaml_()
+                    entry = load(self._data[start:end], ConfigLoader)
+                if not (isinstance(entry, dict) and list(entry) == [alias]):
+                    raise ValueError(f'entry <{alias}> could not be read on its own')
+                self._loaded[alias] = entry[alias]
+            except (YAMLError, ValueError) as error:
+                # e.g. anchors shared between groups: fall back to reading the whole document
+                _log_('info', 'lazy read failed, reading full document: %r', error)
+                with ConfigIO.__sidecars__(self._fpath):
+                    self._loaded = load(self._data, ConfigLoader)
+                self._offsets = dict.fromkeys([alias for alias in self._offsets if alias in self._loaded] + list(self._loaded))
+        
+        return self._loaded[alias]
+    
+    def values(self):
+        for alias in self._offsets:
+            yield self.get(alias)
+    
+    def tree(self) -> dict:
+        # construct all entries in order and release the document
+        tree = {alias:self.get(alias) for alias in self._offsets}
+        self._data = None
+        return tree
+
+class ConfigFormatter:
+    # table definition
+    elbow = "└──"
+    pipe  = "|  "
+    tee   = "├──"
+    blank = "   "
+
+    @classmethod
+    def lines(cls, config: BaseConfig, max_depth:int=None, max_children:int=None, groups:Iterable[str] | Callable=None) -> Iterator[str]:
+        # generate the lines of the config tree one by one, depth first without recursion, such
+        # that memory only grows with the depth of the tree. max_depth limits the number of levels
+        # shown, max_children the number of entries shown per group, and groups selects the groups
+        # shown: either the aliases of the top level groups or a function (alias, group) -> bool
+        # applied to every group. A limit of 0 shows only how many entries were left out
+        for name, limit in (('max_depth', max_depth), ('max_children', max_children)):
+            if not limit is None and limit < 0:
+                raise ValueError(f'{name} must be at least 0, got {limit}')
+
+        if groups is None:
+            keep = None
+        elif callable(groups):
+            keep = lambda depth, alias, child: not hasattr(child, '_tree') or groups(alias, child)
+        else:
+            names = set(groups)
+            keep = lambda depth, alias, child: depth > 0 or not hasattr(child, '_tree') or alias in names
+
+        def entries(tree:dict, depth:int, max_children:int=max_children):
+            # ((alias, child), last) of the visible entries
+            if keep is None and max_children is None:
+                last = len(tree) - 1
+                for n, item in enumerate(tree.items()):
+                    yield item, n == last
+                return
+
+            # otherwise one entry behind to know which one is last
+            visible = iter(tree.items()) if keep is None else (item for item in tree.items() if keep(depth, *item))
+            previous, shown = None, 0
+            for item in visible:
+                if not max_children is None and shown == max_children:
+                    # count the others without rendering them
+                    if not previous is None:
+                        yield previous, False
+                    yield (None, 1 + sum(1 for _ in visible)), True
+                    return
+                if not previous is None:
+                    yield previous, False
+                previous, shown = item, shown + 1
+            if not previous is None:
+                yield previous, True
+
+        yield '::'+str(type(config))+' @ '+"<{}>".format(hex(id(config)))+ f': name "{config._name}"'+ '::'
+
+        # at depth 0 not even the top level is shown
+        stack = [(entries(config._tree, 0, 0 if max_depth == 0 else max_children), '', 0)]
+        while stack:
+            level, header, depth = stack[-1]
+            entry = next(level, None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            (alias, child), last = entry
+            branch = cls.elbow if last else cls.tee
+            if alias is None:
+                yield f'{header}{branch}... ({child} more)'
+                continue
+
+            text = repr(child)
+            line = f'{alias}:' if text == alias else f'{alias}: {text}'
+            if hasattr(child, '_tree'):
+                if max_depth is None or depth + 1 < max_depth:
+                    stack.append((entries(child._tree, depth + 1), header + (cls.blank if last else cls.pipe), depth + 1))
+                elif child._tree:
+                    line += f' ... ({len(child._tree)} entries)'
+            yield header + branch + line
+
+    @classmethod
+    def write(cls, config: BaseConfig, stream:TextIO=None, **kwargs:dict) -> None:
+        # stream the tree to a text stream, by default stdout. kwargs are passed to lines
+        stream = sys.stdout if stream is None else stream
+        for line in cls.lines(config, **kwargs):
+            stream.write(line + '\n')
+
+    @classmethod
+    def format(cls, config: BaseConfig, **kwargs:dict) -> str:
+        # return tree as a single string, kwargs are passed to lines
+        return '\n'.join(cls.lines(config, **kwargs))
 
     @classmethod
     def __repr__(cls, config:Config):
@@ -127,10 +1119,15 @@ class ConfigFormatter:
 
 
 class ConfigHandler:
-    _banned: list[str] = ['register', 'writeto', 'readfrom', 'tree', 'banned', 'strict','verified'] 
+    _banned: list[str] = ['register', 'writeto', 'readfrom', 'tree', 'banned', 'strict','verified', 'verify', 'exists', 'reload', 'watch', 'freeze', 'share', 'areadfrom', 'awriteto', 'read_many', 'add_parameters', 'add_groups', 'from_dict', 'get', 'get_many', 'sweep', 'fork', 'fingerprint'] 
     
     def __init__(self):
         self._initialised = False
+        self._index = None
+        self._parents = list()
+        self._fragment = None
+        self._frozen = None
+        self._digest = None
 
     @staticmethod
     def _isdunder(alias:str) -> bool:
@@ -145,6 +1142,14 @@ class ConfigHandler:
         # return true if name is banned or private (_), private protected (__), dunder or sunder.
         return alias in cls._banned or cls._isdunder(alias) or cls._issunder(alias)
     
+    @staticmethod
+    def _unregistered(alias:str, strict:bool, stacklevel:int=WARNING_STACK_LVL) -> None:
+        # alias was dot searched but not found: if strict raise blocking error, else warn user
+        msg = f"Attribute {alias} was not registered in Config object, please make sure to .register the attribute first"
+        if strict:
+            raise AttributeError(msg)
+        warnings.warn(msg, UserWarning, stacklevel=stacklevel+1)
+
     @classmethod
     def _is_banned_or_registered(cls, obj:dict, alias: str, overwrite:bool, strict:bool):
         # catch banned name:
@@ -174,10 +1179,6 @@ class ConfigHandler:
         # otherwise not banned or registered
         return False
     
-    def __getattribute__(self, __name: str) -> Any:
-        return super().__getattribute__(__name)
-
-    
     def __getattr__(self, obj: Config | BaseConfig, __name: str) -> BaseConfig | Any:
         # check if key is in the _tree
         # searh in child objects
@@ -187,35 +1188,316 @@ class ConfigHandler:
             _tree = object.__getattribute__(obj,'_tree')
             return dict.__getitem__(_tree,__name)
         
-        def dive_tree(child, __name, level:int=0):
-                #if name is registered in _tree, return
-                if __name in child._tree:
-                    return child._tree[__name]
-                
-                for child in child._tree.values():   
-                    # else,
-                    # if it has a _tree --> then its a config object
-                    if hasattr(child,'_tree'):
-                        # dive 1 level deeper
-                        res = dive_tree(child, __name, level=level+1)
-                        if not res is None:
-                            return res
-        # begin elementwise search
-        res = dive_tree(obj, __name)
+        # look up alias in the flattened index of the tree
+        entry = self.lookup(obj, __name)
 
         # if a result was found, return
-        if not res is None:
-            return res
+        if not entry is None:
+            return entry[-1]
         
-        # otherwise
-        # if strict
-        if obj._strict:
-            # raise blocking error
-            raise AttributeError(f"Attribute {__name} was not registered in Config object, please make sure to .register the attribute first")
-        # else warn user
-        warnings.warn(f"Attribute {__name} was not registered in Config object, please make sure to .register the attribute first", UserWarning, stacklevel=WARNING_STACK_LVL)
+        # otherwise raise if strict, else warn user
+        self._unregistered(__name, obj._strict)
+
+    def get(self, obj: Config | BaseConfig, __name: str, default: Any = None) -> BaseConfig | Any:
+        # non raising lookup. The index holds every registered alias, so it doubles as the cache of
+        # known misses: a miss costs a single dict lookup until the tree changes
+        if not obj._handler._initialised:
+            return dict.get(object.__getattribute__(obj, '_tree'), __name, default)
+        entry = self.index(obj).get(__name)
+        return default if entry is None else entry[-1]
+
+    def get_many(self, obj: Config | BaseConfig, names: list[str] | dict[str, Any], default: Any = None) -> list[Any]:
+        # values of names in order, a dict gives a default per name
+        if not obj._handler._initialised:
+            index = {alias:((), value) for alias, value in object.__getattribute__(obj, '_tree').items() if not value is None}
+        else:
+            index = self.index(obj)
+        defaults = names if isinstance(names, dict) else dict.fromkeys(names, default)
+        return [default if entry is None else entry[-1] for entry, default in zip(map(index.get, defaults), defaults.values())]
+
+    # alias index #
+    # every handler keeps a flattened {alias: (group path, value)} index of the tree of its owner.
+    # The index of a node is build from its own _tree and the (cached) indices of its child configs,
+    # in the same order as the depth first dot search: own level first, then child by child.
+    # Child configs keep weak references to the configs that indexed them, such that changes can be
+    # pushed up the tree.
+    def lookup(self, obj: Config | BaseConfig, __name: str) -> tuple[tuple[str, ...], Any] | None:
+        # return (group path, value) of the first match of alias, None if not registered
+        return self.index(obj).get(__name)
+
+    def index(self, obj: Config | BaseConfig) -> dict[str, tuple[tuple[str, ...], Any]]:
+        # build index on first use
+        if self._index is None:
+            index = dict()
+            blocked = set()
+
+            # own level first, a None entry hides the alias for the entire subtree
+            for alias, value in obj._tree.items():
+                if value is None:
+                    blocked.add(alias)
+                else:
+                    index[alias] = ((), value)
+
+            # then dive into the child configs in order
+            for key, child in obj._tree.items():
+                if hasattr(child, '_tree'):
+                    for alias, (path, value) in self._child_index(obj, child).items():
+                        if not (alias in index or alias in blocked):
+                            index[alias] = ((key,) + path, value)
+
+            self._index = index
+        return self._index
+
+    def _child_index(self, obj: Config | BaseConfig, child: BaseConfig) -> dict[str, tuple[tuple[str, ...], Any]]:
+        # make sure child knows it is indexed by obj
+        handler = child._handler
+        if not any(ref() is obj for ref in handler._parents):
+            handler._parents.append(weakref.ref(obj))
+        return handler.index(child)
+
+    def _resolve(self, obj: Config | BaseConfig, __name: str) -> tuple[tuple[str, ...], Any] | None:
+        # resolve a single alias using the indices of the child configs
+        if __name in obj._tree:
+            value = obj._tree[__name]
+            return None if value is None else ((), value)
+        
+        for key, child in obj._tree.items():
+            if hasattr(child, '_tree'):
+                entry = self._child_index(obj, child).get(__name)
+                if not entry is None:
+                    return ((key,) + entry[0], entry[-1])
+
+    def touch(self, obj: Config | BaseConfig, __name: str | None = None) -> None:
+        # update the index after obj._tree changed.
+        # if an alias is given only that entry is updated, otherwise the index is rebuild on next lookup
+        # the serialised fragment, compiled copy and digest of obj are outdated in either case
+        self._fragment = None
+        self._frozen = None
+        self._digest = None
+        if __name is None:
+            self._index = None
+        elif not self._index is None:
+            entry = self._resolve(obj, __name)
+            if entry is None:
+                self._index.pop(__name, None)
+            else:
+                self._index[__name] = entry
+
+        # propagate to every config that indexed obj and is still alive
+        parents = [ref for ref in self._parents if not ref() is None]
+        self._parents = parents
+        for ref in parents:
+            parent = ref()
+            if not parent is None:
+                parent._handler.touch(parent, __name)
+
+    # content fingerprints #
+    # every handler keeps the digest of the content of its owner: its type and its entries in order, where a
+    # group contributes its own digest. touch clears the digest of the changed group and of every group above
+    # it, such that only the groups on the path to a change are hashed again (a Merkle tree). Values that can
+    # change in place, e.g. lists, are hashed again every time, as are the groups holding them.
+    def digest(self, obj: Config | BaseConfig) -> bytes:
+        if self._digest is None:
+            # [digest if nothing in the subtree can change in place, [(alias, digest, group or None for a value)]]
+            entries = list()
+            for alias, value in obj._tree.items():
+                if hasattr(value, '_tree'):
+                    # make sure child knows it is hashed by obj
+                    handler = value._handler
+                    if not any(ref() is obj for ref in handler._parents):
+                        handler._parents.append(weakref.ref(obj))
+                    entries.append((alias, None, value))
+                else:
+                    entries.append((alias, self._digestof_(value) if self._immutable_(value) else None, None))
+            self._digest = [None, entries]
+
+        digest, entries = self._digest
+        if digest is None:
+            import hashlib
+            hasher = hashlib.blake2b(digest_size=16)
+            self._feed_(hasher, ConfigIO._tags.get(type(obj), type(obj).__qualname__))
+            static = True
+            for alias, leaf, group in entries:
+                self._feed_(hasher, alias)
+                if not group is None:
+                    hasher.update(b'g' + group._handler.digest(group))
+                    static &= not group._handler._digest[0] is None
+                else:
+                    static &= not leaf is None
+                    hasher.update(b'v' + (self._digestof_(obj._tree[alias]) if leaf is None else leaf))
+            digest = hasher.digest()
+            if static:
+                self._digest[0] = digest
+        return digest
+
+    def fingerprint(self, obj: Config | BaseConfig, names: Iterable[str] | None = None) -> str:
+        # hex digest of obj, or combined digest of only the given aliases and groups as found by the dot search
+        if names is None:
+            return self.digest(obj).hex()
+        
+        import hashlib
+        hasher = hashlib.blake2b(digest_size=16)
+
+        # independent of the order in which the names are given
+        for name in sorted(set(names)):
+            entry = self.lookup(obj, name)
+            self._feed_(hasher, name)
+            if entry is None:
+                # not registered (yet): registering it later changes the fingerprint
+                self._unregistered(name, obj._strict)
+                hasher.update(b'-')
+            elif hasattr(entry[-1], '_tree'):
+                hasher.update(b'g' + entry[-1]._handler.digest(entry[-1]))
+            else:
+                self._feed_(hasher, entry[-1])
+        return hasher.hexdigest()
+
+    @classmethod
+    def _feed_(cls, hasher: Any, value: Any) -> None:
+        # stable, unambiguous encoding of a parameter: every value starts with its type and the
+        # length of its content, such that no two different values are encoded the same way
+        if value is None or isinstance(value, (bool, int, float, complex)):
+            hasher.update(f'{type(value).__qualname__}:{value!r};'.encode())
+        elif isinstance(value, (str, PurePath)):
+            data = str(value).encode('utf-8', 'surrogatepass')
+            hasher.update(b'%s%d:' % (b'p' if isinstance(value, PurePath) else b's', len(data)) + data)
+        elif isinstance(value, (bytes, bytearray)):
+            hasher.update(b'b%d:' % len(value) + bytes(value))
+        elif hasattr(value, '_tree') and hasattr(value, '_handler'):
+            hasher.update(b'g' + value._handler.digest(value))
+        elif isinstance(value, (list, tuple)):
+            hasher.update(b'%s%d:' % (type(value).__qualname__.encode(), len(value)))
+            for child in value:
+                cls._feed_(hasher, child)
+        elif isinstance(value, (dict, set, frozenset)):
+            # unordered: equal values have equal digests regardless of the order they were build in
+            items = value.items() if isinstance(value, dict) else ((child,) for child in value)
+            digests = sorted(b''.join(cls._digestof_(part) for part in item) for item in items)
+            hasher.update(b'%s%d:' % (type(value).__qualname__.encode(), len(digests)) + b''.join(digests))
+        elif 'numpy' in sys.modules and isinstance(value, sys.modules['numpy'].ndarray):
+            # arrays only exist once numpy is imported
+            array = sys.modules['numpy'].require(value, requirements='C')
+            cls._feed_(hasher, repr((array.dtype.descr, array.shape)))
+            hasher.update(array.reshape(-1).view(sys.modules['numpy'].uint8))
+        elif callable(value) and hasattr(value, '__qualname__'):
+            # functions and classes by name
+            cls._feed_(hasher, f'{getattr(value, "__module__", None)}.{value.__qualname__}')
+        elif hasattr(value, '__dict__'):
+            # e.g. dataclasses: by type and attributes
+            cls._feed_(hasher, f'{type(value).__module__}.{type(value).__qualname__}')
+            cls._feed_(hasher, vars(value))
+        else:
+            cls._feed_(hasher, f'{type(value).__module__}.{type(value).__qualname__}')
+            cls._feed_(hasher, repr(value))
+
+    @classmethod
+    def _immutable_(cls, value: Any) -> bool:
+        # whether the digest of value can be kept: it cannot change in place, or is hashed by name
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes, PurePath)):
+            return True
+        if isinstance(value, (tuple, frozenset)):
+            return all(cls._immutable_(child) for child in value)
+        return callable(value) and hasattr(value, '__qualname__')
+
+    @classmethod
+    def _digestof_(cls, value: Any) -> bytes:
+        import hashlib
+        hasher = hashlib.blake2b(digest_size=16)
+        cls._feed_(hasher, value)
+        return hasher.digest()
+
+    # structural diff #
+    @classmethod
+    def aliases(cls, value:Any) -> set[str]:
+        # all aliases registered in the subtree of value
+        if not hasattr(value, '_tree'):
+            return set()
+        return set(value._tree).union(*(cls.aliases(child) for child in value._tree.values()))
+
+    @classmethod
+    def merge(cls, old:Any, new:Any) -> tuple[Any, set[str]]:
+        # return new with every unchanged (sub)group replaced by the one of old, and the aliases that changed below it
+        if hasattr(old, '_tree') and hasattr(new, '_tree') and type(old) is type(new) and (old._name, old._strict) == (new._name, new._strict):
+            tree, changed = cls.merge_tree(old._tree, new._tree)
+            if tree is old._tree:
+                return old, changed
+            return type(old)._from_state_(old._name, old._strict, tree), changed
+        
+        # parameters
+        try:
+            equal = type(old) is type(new) and not hasattr(new, '_tree') and bool(old == new)
+        except Exception:
+            equal = False
+        
+        if equal:
+            return old, set()
+        return new, cls.aliases(old) | cls.aliases(new)
+
+    @classmethod
+    def merge_tree(cls, old:dict, new:dict) -> tuple[dict, set[str]]:
+        # merge on tree level, returns old itself if nothing changed
+        tree, changed = dict(), set()
+        for alias, value in new.items():
+            if alias in old:
+                tree[alias], subchanged = cls.merge(old[alias], value)
+                changed |= subchanged
+                if not tree[alias] is old[alias]:
+                    changed.add(alias)
+            else:
+                tree[alias] = value
+                changed |= {alias} | cls.aliases(value)
+        
+        for alias in old.keys() - new.keys():
+            changed |= {alias} | cls.aliases(old[alias])
+        
+        # order defines the dot search, so it counts as a change
+        if changed == set() and list(tree) == list(old):
+            return old, changed
+        return tree, changed
+
+    @classmethod
+    def fork(cls, obj:Config | BaseConfig) -> Config | BaseConfig:
+        # copy-on-write view of obj that costs the same regardless of the size of the tree, see ForkTree
+        # construct the groups of a lazily read config first, the fork must not copy its lazy state
+        obj._tree
+        fork = object.__new__(type(obj))
+        fork.__dict__.update(obj.__dict__)
+        fork._tree = ForkTree(obj, fork)
+        fork._handler = ForkHandler(fork, obj)
+
+        # changes to obj are pushed to the fork
+        parents = obj._handler._parents
+        parents.append(weakref.ref(fork))
+        if len(parents) & (len(parents) - 1) == 0:
+            # drop forks that are gone, amortised over many forks
+            parents[:] = [ref for ref in parents if not ref() is None]
+        return fork
+
+    @classmethod
+    def commit(cls, obj:Config | BaseConfig, fork:Config | BaseConfig) -> bool:
+        # apply the changes made in a fork of obj to obj itself, returns whether obj changed. Groups that
+        # were forked are committed into the groups they were forked from, other changes replace the entry
+        tree = fork._tree
+        changes = tree.changes() if isinstance(tree, ForkTree) else tree
+        changed, aliases, structural = False, list(), False
+        for alias, value in changes.items():
+            old = obj._tree.get(alias)
+            if isinstance(getattr(value, '_handler', None), ForkHandler) and value._handler._origin is old:
+                changed |= cls.commit(old, value)
+            elif not (alias in obj._tree and old is value):
+                structural |= alias not in obj._tree or hasattr(old, '_tree') or hasattr(value, '_tree')
+                obj._tree[alias] = value
+                aliases.append(alias)
+
+        # committed groups pushed their changes up already. Structural changes require a rebuild,
+        # otherwise only the changed aliases are updated
+        if structural:
+            obj._handler.touch(obj)
+        else:
+            for alias in aliases:
+                obj._handler.touch(obj, alias)
+        return changed or bool(aliases)
 
-                
     @classmethod
     def add_group(cls, obj:dict, alias:str, configClass: Any, *, overwrite:bool=False, strict:bool=False) -> BaseConfig:
 
@@ -225,7 +1507,7 @@ class ConfigHandler:
         # add as property dynamically: this is dangerous!
         # --> Make sure all <self> altering edge cases are caught before this line\
         obj[alias] = configClass(name=alias, strict=strict)
-        logging.info(f'added group of type <{configClass}> under alias {alias} to config')
+        _log_('info', 'added group of type <%s> under alias %s to config', configClass, alias)
     
         return obj[alias]
 
@@ -240,16 +1522,461 @@ class ConfigHandler:
             # add as property dynamically: this is dangerous!
             # --> Make sure all <self> altering edge cases are caught before this line
             obj[alias] = value
-            logging.info(f'added directory {value} under alias {alias} to config')
+            _log_('info', 'added directory %s under alias %s to config', value, alias)
+
+            # return registered alias
+            return alias
+
+    # bulk registration #
+    @classmethod
+    def _conflicts_(cls, obj:dict, aliases:dict, overwrite:bool, strict:bool) -> set[str]:
+        # validate all aliases in one pass, returns the aliases to skip
+        banned, registered = list(), list()
+        for alias in aliases:
+            if cls._isbanned(alias):
+                banned.append(alias)
+            elif not overwrite and alias in obj:
+                registered.append(alias)
+        if not (banned or registered):
+            return set()
+
+        if strict:
+            # raise blocking error reporting every conflict
+            raise RegistrationError(banned, registered)
+        
+        # otherwise warn user once and skip the conflicting aliases
+        warnings.warn(f'{len(banned)+len(registered)} aliases were not registered. Banned or private names: {banned}. Already registered, provide overwrite=True to overwrite: {registered}.', UserWarning, stacklevel=WARNING_STACK_LVL+1)
+        return set(banned) | set(registered)
+
+    @classmethod
+    def add_groups(cls, obj:dict, groups:dict[str, Any], *, overwrite:bool=False, strict:bool=False) -> dict[str, BaseConfig]:
+        # register {alias: configClass} at once
+        skip = cls._conflicts_(obj, groups, overwrite, strict)
+        created = {alias:configClass(name=alias, strict=strict) for alias, configClass in groups.items() if not alias in skip}
+        obj.update(created)
+
+        if _info_enabled_():
+            for alias, group in created.items():
+                _log_('info', 'added group of type <%s> under alias %s to config', type(group), alias)
+        return created
+
+    @classmethod
+    def add_parameters(cls, obj:dict, parameters:dict[str, Any], *, overwrite:bool=False, strict:bool=False, __finalise_entries__:Callable=lambda x: x, **kwargs:dict) -> list[str]:
+        # register {alias: value} at once, returns the registered aliases
+        skip = cls._conflicts_(obj, parameters, overwrite, strict)
+        if skip:
+            parameters = {alias:value for alias, value in parameters.items() if not alias in skip}
+
+        # finalise all entries depending on config type
+        parameters = __finalise_entries__(parameters, **kwargs)
+        obj.update(parameters)
+
+        if _info_enabled_():
+            for alias, value in parameters.items():
+                _log_('info', 'added directory %s under alias %s to config', value, alias)
+        return list(parameters)
 
     def __getstate__(self):
-        return self.__dict__
+        # the index, back references and serialised fragment are rebuild on demand
+        return {key:value for key, value in self.__dict__.items() if not key in ('_index', '_parents', '_fragment', '_frozen', '_digest')}
     
     def __setstate__(self, state):
+        self.__init__()
         self.__dict__.update(state)
 
+class ForkTree(ChainMap):
+    '''Tree of a fork: reads fall through to the tree of the origin, writes go into the overlay. Groups of the
+    origin are forked when first accessed, such that changes to them stay in the fork as well. The fork of a
+    group follows the origin when the origin replaces that group, unless something was changed in it. The
+    tree of the origin is looked up on every access, such that the fork follows the origin when it replaces
+    its whole tree, e.g. on reload or set_tree.'''
+    def __init__(self, origin:Config | BaseConfig, owner:Config | BaseConfig):
+        # no super().__init__: maps is derived from the origin
+        self._overlay = dict()
+        self._origin = origin
+        self._owner = weakref.ref(owner)
+
+        # {alias: (group of the origin, its fork)}
+        self._forks = dict()
+
+    @property
+    def maps(self) -> list[dict]:
+        # [overlay, current tree of the origin]
+        return [self._overlay, self._origin._tree]
+
+    def __getitem__(self, alias:str) -> Any:
+        overlay, tree = self.maps
+        if alias in overlay:
+            return overlay[alias]
+        value = tree[alias]
+        if not isinstance(value, (Config, BaseConfig)):
+            return value
+
+        origin, fork = self._forks.get(alias, (None, None))
+        if origin is value:
+            return fork
+        if not fork is None and self._changed_(origin, fork):
+            # the origin replaced a group that was changed in the fork: the fork keeps its own
+            overlay[alias] = fork
+            del self._forks[alias]
+            return fork
+
+        # changes to the forked group are pushed up to the owner
+        fork = value.fork()
+        fork._handler._parents.append(self._owner)
+        self._forks[alias] = (value, fork)
+        return fork
+
+    def __setitem__(self, alias:str, value:Any) -> None:
+        self._forks.pop(alias, None)
+        self.maps[0][alias] = value
+
+    @staticmethod
+    def _changed_(origin:Config | BaseConfig, fork:Config | BaseConfig) -> bool:
+        if isinstance(fork._tree, ForkTree):
+            return fork._tree.changed()
+        
+        # groups that are forked by copying, or whose tree was replaced
+        try:
+            return not (type(origin) is type(fork) and bool(origin == fork))
+        except Exception:
+            return True
+
+    def changed(self) -> bool:
+        # whether anything was changed in the fork, including in its forked groups
+        return bool(self.maps[0]) or any(self._changed_(origin, fork) for origin, fork in self._forks.values())
+
+    def changes(self) -> dict:
+        # entries changed in the fork and the forks of the groups of the origin that are still current
+        tree = self.maps[1]
+        changes = {alias:fork for alias, (origin, fork) in self._forks.items() if alias in tree and tree[alias] is origin}
+        changes.update(self.maps[0])
+        return changes
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def __or__(self, other:dict) -> dict:
+        return self.copy() | dict(other)
+
+    def __ror__(self, other:dict) -> dict:
+        return dict(other) | self.copy()
+
+    def __reduce__(self):
+        # pickled as a plain dict. Groups that did not change in the fork are pickled as the groups of the
+        # origin, which pickle writes only once when they are shared, e.g. by the runs of a sweep
+        overlay, tree = self.maps
+        state = dict()
+        for alias in self:
+            if alias in overlay:
+                state[alias] = overlay[alias]
+                continue
+
+            value = state[alias] = tree[alias]
+            origin, fork = self._forks.get(alias, (None, None))
+            if origin is value and self._changed_(origin, fork):
+                state[alias] = fork
+        return dict, (state,)
+
+class ForkIndex(MutableMapping):
+    '''Alias index of a fork: the entries that changed in the fork on top of the index of the origin. Groups
+    found in the index of the origin are served as the forks of the fork tree.'''
+    def __init__(self, fork:Config | BaseConfig, origin:Config | BaseConfig):
+        self._fork = weakref.ref(fork)
+        self._origin = origin
+        # {alias: entry}, a None entry hides the alias of the origin
+        self._delta = dict()
+
+    def _base_(self) -> dict[str, tuple[tuple[str, ...], Any]]:
+        # current index of the origin
+        return self._origin._handler.index(self._origin)
+
+    def get(self, alias:str, default:Any=None) -> tuple[tuple[str, ...], Any] | Any:
+        entry = self._delta.get(alias, False)
+        if entry is False:
+            entry = self._base_().get(alias)
+            if not entry is None and isinstance(entry[-1], (Config, BaseConfig)):
+                node = self._fork()
+                for key in entry[0]:
+                    node = node._tree[key]
+                entry = self._delta[alias] = (entry[0], node._tree[alias])
+        return default if entry is None else entry
+
+    def __getitem__(self, alias:str) -> tuple[tuple[str, ...], Any]:
+        entry = self.get(alias)
+        if entry is None:
+            raise KeyError(alias)
+        return entry
+
+    def __contains__(self, alias:str) -> bool:
+        return not self.get(alias) is None
+
+    def __iter__(self) -> Iterator[str]:
+        delta, base = self._delta, self._base_()
+        for alias in base:
+            if not (alias in delta and delta[alias] is None):
+                yield alias
+        for alias, entry in list(delta.items()):
+            if not (alias in base or entry is None):
+                yield alias
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setitem__(self, alias:str, entry:tuple[tuple[str, ...], Any]) -> None:
+        self._delta[alias] = entry
+
+    def __delitem__(self, alias:str) -> None:
+        self._delta[alias] = None
+
+    def pop(self, alias:str, default:Any=None) -> tuple[tuple[str, ...], Any] | Any:
+        entry = self.get(alias, default)
+        self._delta[alias] = None
+        return entry
+
+class ForkHandler(ConfigHandler):
+    # handler of a fork: the index is an overlay on the index of the origin until the fork changes
+    # structurally, after which it is rebuild from the fork tree as usual
+    def __init__(self, fork:Config | BaseConfig, origin:Config | BaseConfig):
+        super().__init__()
+        self._initialised = True
+        self._index = ForkIndex(fork, origin)
+        self._origin = origin
+
+    def _resolve(self, obj: Config | BaseConfig, __name: str) -> tuple[tuple[str, ...], Any] | None:
+        # resolve through the groups of the origin that were not forked yet, such that resolving an alias
+        # does not fork every group it passes. Changes to those groups reach the fork through the origin
+        tree = obj._tree
+        if not isinstance(tree, ForkTree) or __name in tree:
+            return super()._resolve(obj, __name)
+
+        overlay, origin = tree.maps
+        for key in tree:
+            # groups that were changed in or forked by the fork already are served by the fork
+            forked = key in overlay or tree._forks.get(key, (None,))[0] is origin[key]
+            child = tree[key] if forked else origin[key]
+            if hasattr(child, '_tree'):
+                entry = (self._child_index(obj, child) if forked else child._handler.index(child)).get(__name)
+                if not entry is None:
+                    if forked or not hasattr(entry[-1], '_tree'):
+                        return ((key,) + entry[0], entry[-1])
+
+                    # groups are served as forks
+                    entry = self._child_index(obj, tree[key]).get(__name)
+                    return ((key,) + entry[0], entry[-1])
+
+    def __reduce__(self):
+        # the tree of a fork is pickled as a plain dict, its handler as a plain handler
+        return ConfigHandler, (), {'_initialised':True}
+
+class ConfigProfiler:
+    '''Opt-in instrumentation of the dot search and ConfigIO.
+
+    While enabled, the lookups of ConfigHandler (dot search, get and get_many) and the read and
+    write methods of ConfigIO are replaced by instrumented versions. Disabling restores the originals, so a disabled profiler
+    costs nothing. Only one profiler can be enabled at a time.
+    '''
+    _active: ConfigProfiler | None = None
+    _patched: dict[str, Any] = dict()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # alias: [hits, misses, depth, time]
+        self.lookups: dict[str, list] = dict()
+        # (operation, path): [calls, time]
+        self.io: dict[tuple[str, str], list] = dict()
+
+    @property
+    def enabled(self) -> bool:
+        return ConfigProfiler._active is self
+
+    def enable(self) -> ConfigProfiler:
+        if self.enabled:
+            return self
+        if not ConfigProfiler._active is None:
+            raise RuntimeError('an other ConfigProfiler is already enabled, disable it first')
+        ConfigProfiler._active = self
+
+        # keep originals, instrumented versions are installed on the classes
+        ConfigProfiler._patched = {
+            'lookup':ConfigHandler.__dict__['__getattr__'],
+            'get':ConfigHandler.__dict__['get'],
+            'get_many':ConfigHandler.__dict__['get_many'],
+            'readfrom':ConfigIO.__dict__['readfrom'],
+            'readtree':ConfigIO.__dict__['readtree'],
+            'writeto':ConfigIO.__dict__['writeto'],
+        }
+        ConfigHandler.__getattr__ = self._lookup_(ConfigProfiler._patched['lookup'])
+        ConfigHandler.get = self._get_(ConfigProfiler._patched['get'])
+        ConfigHandler.get_many = self._get_many_(ConfigProfiler._patched['get_many'])
+        ConfigIO.readfrom = classmethod(self._timed_('readfrom', ConfigProfiler._patched['readfrom'].__func__, 1))
+        ConfigIO.readtree = classmethod(self._timed_('readtree', ConfigProfiler._patched['readtree'].__func__, 0))
+        ConfigIO.writeto = classmethod(self._timed_('writeto', ConfigProfiler._patched['writeto'].__func__, 1))
+        return self
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        ConfigHandler.__getattr__ = ConfigProfiler._patched['lookup']
+        ConfigHandler.get = ConfigProfiler._patched['get']
+        ConfigHandler.get_many = ConfigProfiler._patched['get_many']
+        for operation in ['readfrom', 'readtree', 'writeto']:
+            setattr(ConfigIO, operation, ConfigProfiler._patched[operation])
+        ConfigProfiler._patched = dict()
+        ConfigProfiler._active = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self.lookups.clear()
+            self.io.clear()
+
+    def __enter__(self) -> ConfigProfiler:
+        return self.enable()
+
+    def __exit__(self, *args):
+        self.disable()
+
+    # instrumented versions #
+    def _lookup_(self, original:Callable) -> Callable:
+        profiler = self
+
+        def __getattr__(self, obj: Config | BaseConfig, __name: str) -> BaseConfig | Any:
+            # objects that are still being build are not dot searched
+            if not obj._handler._initialised:
+                return original(self, obj, __name)
+
+            # same as ConfigHandler.__getattr__, inlined such that warnings point to the caller
+            start = time.perf_counter()
+            entry = self.lookup(obj, __name)
+            profiler._record_(__name, entry, time.perf_counter() - start)
+
+            if not entry is None:
+                return entry[-1]
+            self._unregistered(__name, obj._strict)
+        return __getattr__
+
+    def _get_(self, original:Callable) -> Callable:
+        profiler = self
+
+        def get(self, obj: Config | BaseConfig, __name: str, default: Any = None) -> BaseConfig | Any:
+            if not obj._handler._initialised:
+                return original(self, obj, __name, default)
+
+            start = time.perf_counter()
+            entry = self.lookup(obj, __name)
+            profiler._record_(__name, entry, time.perf_counter() - start)
+            return default if entry is None else entry[-1]
+        return get
+
+    def _get_many_(self, original:Callable) -> Callable:
+        profiler = self
+
+        def get_many(self, obj: Config | BaseConfig, names: list[str] | dict[str, Any], default: Any = None) -> list[Any]:
+            if not obj._handler._initialised:
+                return original(self, obj, names, default)
+
+            # the time of the batch is shared evenly among its names
+            start = time.perf_counter()
+            index = self.index(obj)
+            defaults = names if isinstance(names, dict) else dict.fromkeys(names, default)
+            entries = list(map(index.get, defaults))
+            elapsed = (time.perf_counter() - start)/max(len(entries), 1)
+            for __name, entry in zip(defaults, entries):
+                profiler._record_(__name, entry, elapsed)
+            return [default if entry is None else entry[-1] for entry, default in zip(entries, defaults.values())]
+        return get_many
+
+    def _record_(self, alias:str, entry:tuple | None, elapsed:float) -> None:
+        with self._lock:
+            record = self.lookups.get(alias)
+            if record is None:
+                record = self.lookups[alias] = [0, 0, None, 0.0]
+            if entry is None:
+                record[1] += 1
+            else:
+                record[0] += 1
+                # depth is the number of groups below the object the lookup started from
+                record[2] = len(entry[0]) if record[2] is None else max(record[2], len(entry[0]))
+            record[3] += elapsed
+
+    def _timed_(self, operation:str, function:Callable, position:int) -> Callable:
+        profiler = self
+
+        def timed(cls, *args, **kwargs):
+            # fpath is the argument at position after cls
+            fpath = args[position] if len(args) > position else kwargs.get('fpath')
+            key = (operation, str(ConfigIO.__default_checks__(fpath)))
+            start = time.perf_counter()
+            try:
+                return function(cls, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with profiler._lock:
+                    record = profiler.io.setdefault(key, [0, 0.0])
+                    record[0] += 1
+                    record[1] += elapsed
+        timed.__name__ = function.__name__
+        return timed
+
+    # reports #
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = {alias:{'hits':hits, 'misses':misses, 'depth':depth, 'time':elapsed} for alias, (hits, misses, depth, elapsed) in self.lookups.items()}
+            io = dict()
+            for (operation, path), (calls, elapsed) in self.io.items():
+                io.setdefault(operation, dict())[path] = {'calls':calls, 'time':elapsed}
+        return {'lookups':lookups, 'io':io}
+
+    def to_json(self, fpath:Path=None, **kwargs:dict) -> str:
+        # return the stats as json, and write them to fpath if given
+        import json
+        text = json.dumps(self.stats(), **kwargs)
+        if not fpath is None:
+            Path(fpath).write_text(text)
+        return text
+
+    def unused(self, config:Config | BaseConfig) -> list[str]:
+        # aliases registered in config that have not been looked up while profiling
+        return sorted(alias for alias in ConfigHandler.aliases(config) if not self.lookups.get(alias, [0])[0])
+
+    def format(self, sort:str='time', limit:int=None) -> str:
+        # cProfile style table, sorted by 'time', 'hits', 'misses', 'depth' or 'alias'
+        stats = self.stats()
+        lookups = stats['lookups']
+        hits = sum(record['hits'] for record in lookups.values())
+        misses = sum(record['misses'] for record in lookups.values())
+        total = sum(record['time'] for record in lookups.values())
+
+        if sort == 'alias':
+            order = sorted(lookups)
+        else:
+            order = sorted(lookups, key=lambda alias: lookups[alias][sort] or 0, reverse=True)
+        if not limit is None:
+            order = order[:limit]
+
+        lines = [f'         {hits+misses} lookups ({misses} misses) in {total:.6f} seconds', '', f'   Ordered by: {sort}', '']
+        lines.append(f'{"hits":>9} {"misses":>8} {"depth":>6} {"tottime":>10} {"percall":>10}  alias')
+        for alias in order:
+            record = lookups[alias]
+            calls = record['hits'] + record['misses']
+            depth = '-' if record['depth'] is None else record['depth']
+            lines.append(f'{record["hits"]:>9} {record["misses"]:>8} {depth:>6} {record["time"]:>10.6f} {record["time"]/calls:>10.6f}  {alias}')
+
+        if stats['io']:
+            lines += ['', f'{"ncalls":>9} {"tottime":>10} {"percall":>10}  operation(path)']
+            for operation, paths in stats['io'].items():
+                for path, record in sorted(paths.items(), key=lambda item: item[1]['time'], reverse=True):
+                    lines.append(f'{record["calls"]:>9} {record["time"]:>10.6f} {record["time"]/record["calls"]:>10.6f}  {operation}({path})')
+        return '\n'.join(lines)
+
+    def print_stats(self, sort:str='time', limit:int=None) -> None:
+        print(self.format(sort, limit))
+
 class Config:
     'Config object that allows you to register variables and IO them to disk uisng the YAML standard.'
+    # serialises reloads
+    _reloading = threading.Lock()
+
     # Initialisation # 
     def __init__(self, name:str='general', strict:bool=False) -> None:
         
@@ -269,13 +1996,25 @@ class Config:
     def strict(self):
         # expose private _strict to user
         return self._strict
+
+    @classmethod
+    def _from_state_(cls, name:str, strict:bool, tree:dict) -> Config:
+        # helper function for IO: restore object without conforming the tree
+        cfg = cls(name=name, strict=strict)
+        cfg.settree(tree)
+        return cfg
     
     def settree(self, _tree)-> None:
         self._tree.update(_tree)
 
+        # groups may have been replaced: rebuild index
+        self._handler.touch(self)
+
     def add_group(self, alias:str, configClass:Any, *, overwrite:bool=False):
         # ask handler to register group
-        return self._handler.add_group(self._tree, alias, configClass, overwrite=overwrite, strict=self.strict)
+        group = self._handler.add_group(self._tree, alias, configClass, overwrite=overwrite, strict=self.strict)
+        self._handler.touch(self)
+        return group
     
     def add_parameter(self, alias, value, *, group:str=None, overwrite=False, **kwargs:dict):
         
@@ -288,28 +2027,193 @@ class Config:
       
         # register in corresponding config object
         obj.add_parameter(alias, value, overwrite=overwrite, strict=self.strict, **kwargs)
-    
-    def __getattribute__(self, __name: str) -> BaseConfig | Any:
-        # basic search handle by itself
-        return super().__getattribute__(__name)
+
+    def add_groups(self, groups:dict[str, Any], *, overwrite:bool=False) -> dict[str, BaseConfig]:
+        # register {alias: configClass} at once
+        created = self._handler.add_groups(self._tree, groups, overwrite=overwrite, strict=self.strict)
+        self._handler.touch(self)
+        return created
+
+    def add_parameters(self, parameters:dict[str, Any], *, group:str=None, overwrite:bool=False, **kwargs:dict) -> list[str]:
+        # register {alias: value} at once in group, by default the root group
+        if group is None:
+            group = self._name
+        return self._tree[group].add_parameters(parameters, overwrite=overwrite, strict=self.strict, **kwargs)
+
+    @classmethod
+    def from_dict(cls, tree:dict, name:str='general', strict:bool=False, groups:dict[str, Any]=None) -> Config:
+        # build a config in bulk: nested dicts are groups, of the class given in groups or BaseConfig,
+        # and parameters at the top level belong to the root group
+        groups = dict() if groups is None else groups
+        cfg = cls(name=name, strict=strict)
+
+        def fill(group:BaseConfig, tree:dict) -> None:
+            # own parameters first, then the subgroups in order
+            group.add_parameters({alias:value for alias, value in tree.items() if not isinstance(value, dict)}, strict=strict)
+            children = group.add_groups({alias:groups.get(alias, BaseConfig) for alias, value in tree.items() if isinstance(value, dict)}, strict=strict)
+            for alias, child in children.items():
+                fill(child, tree[alias])
+
+        root = {alias:value for alias, value in tree.items() if not isinstance(value, dict)} | tree.get(name, {})
+        fill(cfg._tree[name], root)
+        children = cfg.add_groups({alias:groups.get(alias, BaseConfig) for alias, value in tree.items() if isinstance(value, dict) and alias != name})
+        for alias, child in children.items():
+            fill(child, tree[alias])
+        return cfg
     
     def __getattr__(self, __name) -> BaseConfig | Any:
+        # lazily read config: construct groups on first access
+        if '_lazy' in self.__dict__:
+            return self._lazy_getattr_(__name)
+
         # otherwise ask _handler for more advanced search
         return self._handler.__getattr__(self, __name)
     
+    def _lazy_getattr_(self, __name) -> BaseConfig | Any:
+        # any direct use of the tree constructs all groups
+        if __name == '_tree':
+            return self._materialise_()
+
+        entry = self._lazy_lookup_(__name)
+        if not entry is None:
+            return entry[-1]
+        
+        # not registered: let handler deal with it
+        self._materialise_()
+        return self._handler.__getattr__(self, __name)
+
+    def _lazy_lookup_(self, __name) -> tuple[tuple[str, ...], Any] | None:
+        lazy = self._lazy
+
+        # same order as the dot search: top level first
+        if __name in lazy:
+            value = lazy.get(__name)
+            return None if value is None else ((), value)
+        
+        # then group by group, only constructing groups until a match is found
+        for child in lazy.values():
+            if hasattr(child, '_tree'):
+                entry = child._handler.lookup(child, __name)
+                if not entry is None:
+                    return entry
+
+    def get(self, name:str, default:Any=None) -> BaseConfig | Any:
+        # dot search that returns default if name is not registered, without raising or warning
+        if '_lazy' in self.__dict__:
+            entry = self._lazy_lookup_(name)
+            if not entry is None:
+                return entry[-1]
+            # a miss has seen every group
+            self._materialise_()
+        return self._handler.get(self, name, default)
+
+    def get_many(self, names:list[str] | dict[str, Any], default:Any=None) -> list[Any]:
+        # dot search of many names at once, a dict of {name: default} gives a default per name
+        if '_lazy' in self.__dict__:
+            defaults = names if isinstance(names, dict) else dict.fromkeys(names, default)
+            return [self.get(name, default) for name, default in defaults.items()]
+        return self._handler.get_many(self, names, default)
+
+    def _materialise_(self) -> dict:
+        # construct all remaining groups of a lazily read config
+        self._tree = self._lazy.tree()
+        del self._lazy
+        self._handler.touch(self)
+        return self._tree
+    
     def __contains__(self, __key):
+        if '_lazy' in self.__dict__:
+            return __key in self._lazy
         return self._tree.__contains__(__key)
     
      # IO #
-    def writeto(self, fpath:Path=None) -> None:
-        # write using IO object
-        ConfigIO.writeto(self, fpath=fpath)
+    def writeto(self, fpath:Path=None, fsync:bool=False, reuse:bool=False, backend:str=None) -> None:
+        # write using IO object, reuse the serialised groups that did not change
+        ConfigIO.writeto(self, fpath=fpath, fsync=fsync, reuse=reuse, backend=backend)
 
     @classmethod
-    def readfrom(cls, fpath:Path=None) -> Config:
+    def readfrom(cls, fpath:Path=None, cache:bool=None, lazy:bool=False, backend:str=None) -> Config:
         # read using IO object
-        return ConfigIO.readfrom(cls, fpath=fpath)
+        return ConfigIO.readfrom(cls, fpath=fpath, cache=cache, lazy=lazy, backend=backend)
+
+    async def awriteto(self, fpath:Path=None, fsync:bool=False, reuse:bool=False, backend:str=None, executor:Executor=None) -> None:
+        # write without blocking the event loop
+        await ConfigIO.awriteto(self, fpath=fpath, fsync=fsync, reuse=reuse, backend=backend, executor=executor)
+
+    @classmethod
+    async def areadfrom(cls, fpath:Path=None, cache:bool=None, lazy:bool=False, backend:str=None, executor:Executor=None) -> Config:
+        # read without blocking the event loop
+        return await ConfigIO.areadfrom(cls, fpath=fpath, cache=cache, lazy=lazy, backend=backend, executor=executor)
+
+    @classmethod
+    async def read_many(cls, fpaths:list[Path], limit:int=8, cache:bool=None, backend:str=None, executor:Executor=None) -> list[Config | Exception]:
+        # read many files concurrently, see ConfigIO.read_many
+        return await ConfigIO.read_many(cls, fpaths, limit=limit, cache=cache, backend=backend, executor=executor)
     
+    def _source_(self, fpath:Path=None) -> tuple[Path, ConfigBackend | None]:
+        # file and backend to reload from, by default those the config was read from
+        if not fpath is None:
+            return ConfigIO.__default_checks__(fpath), None
+        if not '_source' in self.__dict__:
+            raise ValueError('config was not read from a file, please provide the path to reload from')
+        return self._source
+
+    def reload(self, fpath:Path=None, backend:str=None) -> set[str]:
+        # re-read the file and apply only the groups and parameters that changed, returns the changed aliases
+        fpath, source = self._source_(fpath)
+        loaded = ConfigIO.readtree(fpath, backend=source if backend is None else backend)
+
+        with self._reloading:
+            tree, changed = ConfigHandler.merge_tree(self._tree, loaded)
+            if tree is self._tree:
+                return changed
+            
+            # build index of the new tree before it is visible to readers
+            handler = ConfigHandler()
+            handler._initialised = True
+            handler._parents = self._handler._parents
+            staging = object.__new__(type(self))
+            staging.__dict__.update(self.__dict__, _tree=tree, _handler=handler)
+            handler.index(staging)
+
+            # swap both at once: dict.update does not release the GIL in between
+            self.__dict__.update(_tree=tree, _handler=handler)
+
+            # let the groups know they are indexed by self, and the configs indexing self that it changed
+            for child in tree.values():
+                if hasattr(child, '_tree'):
+                    handler._child_index(self, child)
+            for ref in list(handler._parents):
+                parent = ref()
+                if not parent is None:
+                    parent._handler.touch(parent)
+        
+        return changed
+    
+    def watch(self, fpath:Path=None, interval:float=1.0, callback:Callable=None) -> ConfigWatcher:
+        # reload in a background thread whenever the file changes, see ConfigWatcher
+        return ConfigWatcher(self, fpath=fpath, interval=interval, callback=callback).start()
+
+    def freeze(self) -> FrozenConfig:
+        # compile into an immutable copy where every alias is a plain attribute
+        return FrozenConfig.compile(self)
+
+    def share(self, name:str=None) -> SharedConfig:
+        # freeze into a read-only snapshot in shared memory, that worker processes can attach to by name
+        return SharedConfig.freeze(self, name=name)
+
+    def sweep(self, axes:dict[str, Iterable | Callable], mode:str='grid', samples:int=None, seed:int=0) -> ConfigSweep:
+        # lazy run configs for the values of the swept aliases, see ConfigSweep
+        return ConfigSweep(self, axes, mode=mode, samples=samples, seed=seed)
+
+    def fork(self) -> Config:
+        # copy-on-write view: reads fall through to self, changes stay in the fork
+        return self._handler.fork(self)
+
+    def fingerprint(self, names:Iterable[str]=None) -> str:
+        # content fingerprint of the config, or the combined fingerprint of only the given aliases and groups
+        return self._handler.fingerprint(self, names)
+
     def __add__(self, other):
         self.settree(other._tree)
         return self
@@ -318,13 +2222,18 @@ class Config:
         return ConfigFormatter.__repr__(self)
     
     def __iter__(self):
-        for child in self._tree.values():
+        # lazily read groups are constructed one by one
+        children = self._lazy.values() if '_lazy' in self.__dict__ else self._tree.values()
+        for child in children:
             yield child 
     
     def verified(self):
         return False
     
     def __getstate__(self):
+        # lazily read groups cannot be shared
+        if '_lazy' in self.__dict__:
+            self._materialise_()
         return self.__dict__
     
     def __setstate__(self, state):
@@ -354,7 +2263,10 @@ class BaseConfig:
         if self._tree != {}:
             # after initialisation if tree is not empty, make sure it conforms to __finalise_entry__
             
-            self._tree = {alias:self.__finalise_entry__(alias, value)[-1] for alias, value in self._tree.items()}
+            # in place and only the entries that change, the tree may be the overlay of a fork or forked itself
+            tree = self._tree
+            conformed = {alias:self.__finalise_entry__(alias, value)[-1] for alias, value in tree.items()}
+            tree.update({alias:value for alias, value in conformed.items() if not value is tree[alias]})
     
     # # defined properties #
     def __finalise_entry__(self, alias:str, value:Any, **kwargs: dict):
@@ -364,31 +2276,34 @@ class BaseConfig:
         # return alias and value to add
         return alias, value
 
+    def __finalise_entries__(self, entries:dict, **kwargs: dict) -> dict:
+        '''function called before many entries are registered at once, by default __finalise_entry__ per entry.
+        Overwrite this function when the entries can be finalised faster together.'''
+        if type(self).__finalise_entry__ is BaseConfig.__finalise_entry__:
+            # nothing to finalise
+            return entries
+        return dict(self.__finalise_entry__(alias, value, **kwargs) for alias, value in entries.items())
+
     def __contains__(self, __key):
         self._tree.__contains__(__key)    
 
-    def get(self, name:str, **kwargs:dict):
-        # getter with default value if not registered in config.
-        # will check if name is in self.__dict__ if AttributeError, will check
-        # self._handler._tree if AttributeError again --> return default if defined
-        self.__getattr__(name)
-        
-        if 'default' in kwargs:
-            # return 
-            return kwargs.pop('default')
-        else:
-            # otherwise if strict throw error else warn user
-            if self._strict:
-                raise AttributeError
-            else:
-                warnings.warn(f'alias <{name}> not registerd in <{self}> or children theirin', UserWarning, stacklevel=WARNING_STACK_LVL)
+    def get(self, name:str, default:Any=None) -> BaseConfig | Any:
+        # dot search that returns default if name is not registered, without raising or warning
+        return self._handler.get(self, name, default)
+
+    def get_many(self, names:list[str] | dict[str, Any], default:Any=None) -> list[Any]:
+        # dot search of many names at once, a dict of {name: default} gives a default per name
+        return self._handler.get_many(self, names, default)
+
+    def fork(self) -> BaseConfig:
+        # copy-on-write view: reads fall through to self, changes stay in the fork
+        return self._handler.fork(self)
+
+    def fingerprint(self, names:Iterable[str]=None) -> str:
+        # content fingerprint of the group, or the combined fingerprint of only the given aliases and groups
+        return self._handler.fingerprint(self, names)
 
-                                
 
-    def __getattribute__(self, __name: str) -> BaseConfig | Any:
-        # callback hook for every dot search
-        return super().__getattribute__(__name)
-    
     def __getattr__(self, __name: str) -> BaseConfig | Any:
         # handle advanced search using handler
         return self._handler.__getattr__(self, __name)
@@ -407,11 +2322,35 @@ class BaseConfig:
 
     def add_group(self, alias:str, configClass:Any, *, overwrite:bool=False, strict:bool=False):
         # ask handler to register group
-        return self._handler.add_group(self._tree, alias, configClass, overwrite=overwrite, strict=strict)
+        group = self._handler.add_group(self._tree, alias, configClass, overwrite=overwrite, strict=strict)
+        self._handler.touch(self)
+        return group
     
     def add_parameter(self, alias:str, value:Any, *, overwrite:bool=False, strict:bool=False, **kwargs:dict) -> None:
+        # keep track of replaced groups
+        old = self._tree.get(alias)
+
         # check if alias is valid
-        self._handler.add_parameter(self._tree, alias, value, overwrite=overwrite, strict=strict, __finalise_entry__=self.__finalise_entry__, **kwargs)
+        alias = self._handler.add_parameter(self._tree, alias, value, overwrite=overwrite, strict=strict, __finalise_entry__=self.__finalise_entry__, **kwargs)
+
+        # update index: structural changes require a rebuild, otherwise only update alias
+        if not alias is None:
+            if hasattr(old, '_tree') or hasattr(self._tree[alias], '_tree'):
+                self._handler.touch(self)
+            else:
+                self._handler.touch(self, alias)
+
+    def add_groups(self, groups:dict[str, Any], *, overwrite:bool=False, strict:bool=False) -> dict[str, BaseConfig]:
+        # register {alias: configClass} at once
+        created = self._handler.add_groups(self._tree, groups, overwrite=overwrite, strict=strict)
+        self._handler.touch(self)
+        return created
+
+    def add_parameters(self, parameters:dict[str, Any], *, overwrite:bool=False, strict:bool=False, **kwargs:dict) -> list[str]:
+        # register {alias: value} at once, validating and finalising all entries in one pass
+        aliases = self._handler.add_parameters(self._tree, parameters, overwrite=overwrite, strict=strict, __finalise_entries__=self.__finalise_entries__, **kwargs)
+        self._handler.touch(self)
+        return aliases
 
     @classmethod
     def _create_(cls, tree:dict, name:str, strict:bool):
@@ -422,6 +2361,15 @@ class BaseConfig:
         # return new object with intialised tree
         return cfg
 
+    @classmethod
+    def _from_state_(cls, name:str, strict:bool, tree:dict) -> BaseConfig:
+        # helper function for IO: restore object without conforming the tree,
+        # as it was already conformed before it was written to disk
+        cfg = cls(name=name, strict=strict)
+        cfg._tree.update(tree)
+        cfg._handler.touch(cfg)
+        return cfg
+
     # UI #
     def __repr__(self) -> str:
        return ConfigFormatter.__repr__(self)
@@ -446,6 +2394,9 @@ class BaseConfig:
         # and make sure that the tree conforms to the subclass specific rules
         self.__conform_subclass__()
 
+        # rebuild index on next lookup
+        self._handler.touch(self)
+
     def __enter__(self) -> dict:
         # return tree dict
         return self.tree
@@ -455,36 +2406,107 @@ class BaseConfig:
         
 
 class FileConfig(BaseConfig):
+    # filesystem checks of many paths run on a bounded thread pool. Results can be cached
+    # for cache_ttl seconds, such that repeated checks do not hit (network) filesystems again.
+    workers: int = 8
+    cache_ttl: float | None = None
+    _cache: dict[Path, tuple[float, bool]] = dict()
+    _cachelock = threading.Lock()
+
+    @classmethod
+    def exists(cls, paths:list[Path], create:bool=False) -> dict[Path, bool]:
+        # check if paths exist (and create them if they do not), returns existence per path
+        now = time.monotonic()
+        results, todo = dict(), list()
+        with cls._cachelock:
+            for path in dict.fromkeys(paths):
+                entry = cls._cache.get(path) if cls.cache_ttl else None
+                if not entry is None and entry[0] > now and (entry[1] or not create):
+                    results[path] = entry[1]
+                else:
+                    todo.append(path)
+
+        def check(path:Path) -> bool:
+            if path.exists():
+                return True
+            if not create:
+                return False
+            
+            try:
+                path.mkdir(parents=True, exist_ok=True)
+            except OSError as error:
+                _log_('warning', 'Directory %s could not be created: %r', path, error)
+                return False
+            _log_('info', 'Directory %s successfully created!', path)
+            return True
+
+        if len(todo) > 1 and cls.workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(cls.workers, len(todo))) as pool:
+                checked = dict(zip(todo, pool.map(check, todo)))
+        else:
+            checked = {path:check(path) for path in todo}
+
+        if cls.cache_ttl:
+            with cls._cachelock:
+                cls._cache.update({path:(now + cls.cache_ttl, exists) for path, exists in checked.items()})
+        
+        return results | checked
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cachelock:
+            cls._cache.clear()
+
+    def _missing_(self, alias:str, value:Path) -> None:
+        if self._strict:
+            # in case strict: throw blocking error     
+            raise FileNotFoundError(f'Did not find directory <{value}>.')
+        
+        # warn user and do nothing
+        warnings.warn(f'directory "{value}", registered as <{alias}>, does not exist on system!', UserWarning, stacklevel=WARNING_STACK_LVL+1)
+
     def __finalise_entry__(self, alias:str, value:Path, **kwargs:dict):
         
         # catch typing edge case
         if type(value) is str:
             value = Path(value)
 
-         # check if exists on system -> not?
-        if not value.exists():
-            
-            # if allowed to create 
-            if kwargs.pop('forcecreate', False):
-                # then create
-                value.mkdir(parents=True)
-                logging.info(f'Directory {value} successfully created!')
-
-            elif self._strict:
-                # in case strict: throw blocking error     
-                raise FileNotFoundError(f'Did not find directory <{value}>.')
-            else:
-
-                # warn user and do nothing
-                warnings.warn(f'directory "{value}", registered as <{alias}>, does not exist on system!', UserWarning, stacklevel=WARNING_STACK_LVL)
+         # check if exists on system (if allowed create) -> not?
+        if not self.exists([value], create=kwargs.pop('forcecreate', False))[value]:
+            self._missing_(alias, value)
         
         # return alias and value to register
         return alias, value
     
+    def __finalise_entries__(self, entries:dict, **kwargs:dict) -> dict:
+        # check all paths at once, such that the filesystem is checked in parallel
+        entries = {alias:Path(value) if type(value) is str else value for alias, value in entries.items()}
+        exists = self.exists(list(entries.values()), create=kwargs.pop('forcecreate', False))
+        for alias, value in entries.items():
+            if not exists[value]:
+                self._missing_(alias, value)
+        return entries
+
+    def __conform_subclass__(self):
+        # conform all entries at once, such that the filesystem is checked in parallel
+        if self._tree != {}:
+            # in place, the tree may be the overlay of a fork or forked itself
+            self._tree.update({alias:Path(value) for alias, value in self._tree.items() if type(value) is str})
+            for alias, exists in self.verify().items():
+                if not exists:
+                    self._missing_(alias, self._tree[alias])
+
     # derived properties #
+    def verify(self, create:bool=False) -> dict[str, bool]:
+        # check (and create) all registered directories at once, returns existence per alias
+        paths = {alias:value for alias, value in self._tree.items() if isinstance(value, PurePath)}
+        exists = self.exists(list(paths.values()), create=create)
+        return {alias:exists[path] for alias, path in paths.items()}
+
     def verified(self) -> bool:
         # verify that all registered directories exists on system
-        return all([path.exists() for path in self._tree.values() if not self._tree is None])
+        return all(self.verify().values())
 
 class ModelConfig(BaseConfig):
     def __finalise_entry__(self, alias: str, value: Any, **kwargs: dict):
@@ -499,66 +2521,871 @@ class ModelConfig(BaseConfig):
         # return alias and value to register
         return alias, model
 
-class ArgumentParserWithFallback(ArgumentParser):
-    def __init__(self, fallback:Config|None=None, **kwargs) -> None:
-        # get standard behaviour
-        super().__init__(**kwargs)
+class ArrayHandler(ConfigHandler):
+    # the fields of structured arrays are indexed as aliases of their own, as views on the array
+
+    def index(self, obj: ArrayConfig) -> dict[str, tuple[tuple[str, ...], Any]]:
+        if self._index is None:
+            index = super().index(obj)
+            for alias, value in obj._tree.items():
+                for field in getattr(getattr(value, 'dtype', None), 'names', None) or ():
+                    if not (field in index or field in obj._tree):
+                        index[field] = ((alias,), value[field])
+        return self._index
+
+    def touch(self, obj: ArrayConfig, __name: str | None = None) -> None:
+        # fields depend on the whole array, always rebuild
+        super().touch(obj)
+
+class ArrayConfig(BaseConfig):
+    '''Group of numeric parameters stored as NumPy arrays.
+
+    Values are converted with numpy.asarray, so arrays are stored without copying and the dot search
+    returns the array itself. The fields of structured arrays can be looked up by name as well.
+    When written to a file the arrays are stored in .npy sidecars, which are read memory mapped.
+    '''
+    def __init__(self, name:str, strict:bool):
+        if _optional_('numpy') is None:
+            raise ImportError('ArrayConfig requires numpy, install it with pip install numpy')
+        super().__init__(name, strict)
+
+        self._handler = ArrayHandler()
+        self._handler._initialised = True
+
+    def __finalise_entry__(self, alias:str, value:Any, **kwargs:dict):
+        array = _optional_('numpy').asarray(value)
+
+        # only numbers and records of numbers
+        if not (array.dtype.kind in 'biufc' or array.dtype.names):
+            if self._strict:
+                # in case strict: throw blocking error
+                raise TypeError(f'<{alias}> of dtype {array.dtype} is not numeric, ArrayConfig only holds numeric and structured arrays.')
+            
+            # warn user and register value as is
+            warnings.warn(f'<{alias}> of dtype {array.dtype} is not numeric and was registered as is.', UserWarning, stacklevel=WARNING_STACK_LVL+1)
+            return alias, value
+
+        # return alias and value to register
+        return alias, array
 
-        # if fallback config not given, initialise regular argument parser
-        # else assign fallback_config
-        if not fallback is None:
-            self._fallback_config = fallback
+    @classmethod
+    def _from_state_(cls, name:str, strict:bool, tree:dict) -> ArrayConfig:
+        # 0-d arrays are written as the number they hold
+        numpy = _optional_('numpy')
+        return super()._from_state_(name, strict, {alias:numpy.asarray(value) if isinstance(value, (bool, int, float)) else value for alias, value in tree.items()})
+
+    def fork(self) -> ArrayConfig:
+        # the index holds the fields of the arrays, which an overlay cannot track:
+        # fork copies the tree instead, the arrays themselves are shared
+        return self._from_state_(self._name, self._strict, self._tree)
+
+    def __eq__(self, other) -> bool:
+        # arrays compare element wise
+        numpy = _optional_('numpy')
+        return isinstance(other, BaseConfig) and self._tree.keys() == other._tree.keys() and all(
+            numpy.array_equal(value, other._tree[alias]) if isinstance(value, numpy.ndarray) else value == other._tree[alias]
+            for alias, value in self._tree.items()
+        )
+
+class LayeredConfig:
+    '''Ordered stack of config sources, e.g. base, site, environment and run overrides. Later layers
+    override earlier ones group by group, and lookups are served from the index of the merged tree,
+    such that they cost the same regardless of the number of layers.'''
+    def __init__(self, *sources:Config | Path | str | dict, name:str='general', strict:bool=False):
+        self._name = name
+        self._strict = strict
+
+        # every layer is a (name, source, top level tree) tuple
+        self._layers = list()
+        for source in sources:
+            self._layers.append(self._layer_(source))
+        
+        self._merged = Config(name=name, strict=strict)
+        self._rebuild_()
+
+    @property
+    def strict(self) -> bool:
+        return self._strict
+
+    @property
+    def config(self) -> Config:
+        # merged config, do not modify directly
+        return self._merged
+    
+    @property
+    def layers(self) -> list[str]:
+        return [layer[0] for layer in self._layers]
+
+    # sources #
+    @staticmethod
+    def environ(prefix:str, environ:dict=None) -> dict:
+        # dict source from environment variables: <prefix>ORDER sets order in the root group,
+        # <prefix>FITTING__ORDER sets order in group fitting. Names are lower cased, values parsed as YAML scalars.
+        environ = os.environ if environ is None else environ
+
+        source = dict()
+        for key, text in environ.items():
+            if not key.startswith(prefix):
+                continue
+
+            _yaml_()
+            try:
+                value = load(text, ConfigLoader)
+            except YAMLError:
+                value = text
+            
+            *path, alias = key[len(prefix):].lower().split('__')
+            if alias == '':
+                continue
+
+            tree = source
+            for group in path:
+                tree = tree.setdefault(group, dict())
+            tree[alias] = value
+        return source
+
+    def _layer_(self, source:Config | Path | str | dict, name:str=None) -> tuple[str, Any, dict]:
+        # normalise source to a top level tree
+        if hasattr(source, '_tree'):
+            tree = dict(source._tree)
+        elif isinstance(source, (str, PurePath)):
+            tree = ConfigIO.readtree(source)
+        elif isinstance(source, dict):
+            tree = self._fromdict_(source)
         else:
-            return ArgumentParser(**kwargs)
+            raise TypeError(f'unsupported config source of type <{type(source)}>')
+
+        if name is None:
+            name = str(source) if isinstance(source, (str, PurePath)) else f'layer{len(self._layers)}'
+        return name, source, tree
+
+    def _fromdict_(self, source:dict) -> dict:
+        # nested dicts are groups, parameters at the top level belong to the root group
+        def group(alias:str, tree:dict) -> BaseConfig:
+            return BaseConfig._from_state_(alias, self._strict, {key:group(key, value) if isinstance(value, dict) else value for key, value in tree.items()})
         
-        # initialise return product 
-        self._parsed_args = dict()
+        tree = {alias:group(alias, value) for alias, value in source.items() if isinstance(value, dict)}
+        root = {alias:value for alias, value in source.items() if not isinstance(value, dict)}
+        if root != {}:
+            tree[self._name] = BaseConfig._from_state_(self._name, self._strict, root | (tree[self._name]._tree if self._name in tree else {}))
+        return tree
 
-    def __enter__(self):
-        return self
+    # merging #
+    @classmethod
+    def _merge_(cls, values:list) -> Any:
+        # deep merge of the values of one alias in all layers, last layer wins
+        if len(values) == 1 or not all(hasattr(value, '_tree') for value in values[-2:]):
+            return values[-1]
+        
+        # merge groups from the last layer that does not define a parameter
+        start = len(values) - 1
+        while start > 0 and hasattr(values[start-1], '_tree'):
+            start -= 1
+        groups = values[start:]
+
+        tree = dict()
+        for group in groups:
+            for alias in group._tree:
+                tree.setdefault(alias, None)
+        for alias in tree:
+            tree[alias] = cls._merge_([group._tree[alias] for group in groups if alias in group._tree])
+        
+        first = groups[0]
+        return type(first)._from_state_(first._name, first._strict, tree)
+
+    def _resolve_(self, alias:str) -> Any:
+        return self._merge_([tree[alias] for _, _, tree in self._layers if alias in tree])
+
+    def _order_(self) -> list[str]:
+        # top level aliases in order of first appearance, which is the order of the dot search
+        aliases = dict()
+        for _, _, tree in self._layers:
+            aliases.update(dict.fromkeys(tree))
+        return list(aliases)
+
+    def _rebuild_(self, aliases:list[str]=None) -> None:
+        # merge all layers, in order of first appearance
+        if aliases is None:
+            aliases = self._order_()
+        
+        merged = self._merged
+        merged._tree.clear()
+        merged.settree({alias:self._resolve_(alias) for alias in aliases})
+
+    # layers #
+    def _position_(self, layer:int | str) -> int:
+        if isinstance(layer, str):
+            return self.layers.index(layer)
+        return layer
+
+    def add_layer(self, source:Config | Path | str | dict, name:str=None) -> None:
+        # push layer on top of the stack
+        self._layers.append(self._layer_(source, name))
+        self._apply_(self._layers[-1][-1].keys())
+
+    def set_layer(self, layer:int | str, source:Config | Path | str | dict) -> None:
+        # replace layer, only the aliases defined by the old or new layer are updated
+        position = self._position_(layer)
+        old = self._layers[position]
+        self._layers[position] = self._layer_(source, old[0])
+        self._apply_(old[-1].keys() | self._layers[position][-1].keys())
+
+    def refresh(self, layer:int | str) -> None:
+        # re-read the source of layer, e.g. after its file or Config changed
+        position = self._position_(layer)
+        self.set_layer(position, self._layers[position][1])
+    
+    def remove_layer(self, layer:int | str) -> None:
+        old = self._layers.pop(self._position_(layer))
+        self._apply_(old[-1].keys())
+
+    def _apply_(self, aliases:set[str]) -> None:
+        # update top level aliases of the merged tree
+        merged = self._merged
+        tree = merged._tree
+        order = self._order_()
+
+        # new, removed or reordered top level aliases change the order of the dot search: rebuild
+        if list(tree) != order:
+            self._rebuild_(order)
+            return
+        
+        for alias in aliases:
+            old, new = tree[alias], self._resolve_(alias)
+            tree[alias] = new
+            
+            # only update the index entries of the aliases below the replaced value
+            for changed in {alias} | ConfigHandler.aliases(old) | ConfigHandler.aliases(new):
+                merged._handler.touch(merged, changed)
+
+    # lookups #
+    def __getattr__(self, __name:str) -> BaseConfig | Any:
+        # private names are never registered
+        if __name[:1] == '_':
+            raise AttributeError(__name)
+        return self._merged._handler.__getattr__(self._merged, __name)
+
+    def get(self, name:str, default:Any=None) -> BaseConfig | Any:
+        return self._merged.get(name, default)
+
+    def get_many(self, names:list[str] | dict[str, Any], default:Any=None) -> list[Any]:
+        return self._merged.get_many(names, default)
+
+    def fingerprint(self, names:Iterable[str]=None) -> str:
+        return self._merged.fingerprint(names)
+    
+    def __contains__(self, __key:str) -> bool:
+        return __key in self._merged
+    
+    def __iter__(self):
+        return iter(self._merged)
+    
+    def __repr__(self) -> str:
+        return ConfigFormatter.format(self._merged)
+
+class ConfigSweep:
+    '''Lazy parameter sweep over a base config. Every run config is a fork of the base that overrides the
+    swept aliases: only the groups on the path to an overridden alias are forked, all other reads fall
+    through to the base. Runs are numbered by a stable run index, such that run i is the same config
+    however, and in whatever order, the sweep is iterated.'''
+    modes = ('grid', 'zip', 'random')
+
+    def __init__(self, base:Config, axes:dict[str, Iterable | Callable], mode:str='grid', samples:int=None, seed:int=0):
+        if not mode in self.modes:
+            raise ValueError(f'unknown sweep mode {mode}, expected one of {", ".join(self.modes)}')
+        
+        self._base = base
+        self._mode = mode
+        self._seed = seed
+
+        # callables draw a value from a random.Random, only in random mode
+        self._axes = {alias:(values if mode == 'random' and callable(values) else list(values)) for alias, values in axes.items()}
+        self._sizes = [None if callable(values) else len(values) for values in self._axes.values()]
+
+        # resolve the group of every swept alias once
+        index = base._handler.index(base)
+        unknown = [alias for alias in self._axes if not alias in index]
+        if unknown:
+            raise ValueError(f'cannot sweep unregistered aliases: {", ".join(unknown)}')
+        self._paths = {alias:index[alias][0] for alias in self._axes}
+
+        if mode == 'grid':
+            self._len = math.prod(self._sizes)
+        elif mode == 'zip':
+            if len(set(self._sizes)) > 1:
+                raise ValueError(f'zip sweep needs axes of equal length, got {self._sizes}')
+            self._len = self._sizes[0] if self._sizes else 1
+        else:
+            if samples is None:
+                raise ValueError('random sweep needs the number of samples')
+            self._len = samples
+
+    def __len__(self) -> int:
+        return self._len
+
+    def overrides(self, run:int) -> dict[str, Any]:
+        # {alias: value} of run, decoded from the run index alone
+        if not -self._len <= run < self._len:
+            raise IndexError(f'run {run} out of range of sweep with {self._len} runs')
+        run %= self._len
+
+        if self._mode == 'zip':
+            return {alias:values[run] for alias, values in self._axes.items()}
+        
+        if self._mode == 'random':
+            # one generator per run, seeded by seed and run index
+            import random
+            rng = random.Random(f'{self._seed}:{run}')
+            return {alias:values(rng) if callable(values) else rng.choice(values) for alias, values in self._axes.items()}
+
+        # grid: mixed radix, last axis varies fastest as in itertools.product
+        overrides = dict()
+        for (alias, values), size in zip(reversed(self._axes.items()), reversed(self._sizes)):
+            run, digit = divmod(run, size)
+            overrides[alias] = values[digit]
+        return dict(reversed(overrides.items()))
+
+    def __getitem__(self, run:int) -> Config:
+        return self.config(self.overrides(run))
     
-    def __exit__(self, exc_type, exc_value, traceback):
+    def __iter__(self) -> Iterator[tuple[int, Config]]:
+        # (run index, run config) in order of the run index
+        for run in range(self._len):
+            yield run, self[run]
+
+    def chunks(self, size:int, start:int=0, stop:int=None) -> Iterator[list[tuple[int, Config]]]:
+        # lists of (run index, run config) of at most size runs, e.g. one task of a process pool per chunk.
+        # Runs of a chunk share their unchanged groups, which pickle then only writes once per chunk
+        stop = self._len if stop is None else min(stop, self._len)
+        for first in range(start, stop, size):
+            yield [(run, self[run]) for run in range(first, min(first + size, stop))]
+
+    def config(self, overrides:dict[str, Any]) -> Config:
+        # run config: a fork of the base with overrides applied, such that changing a run changes neither
+        # the base nor any other run. Only the groups on the path to an overridden alias are forked
+        run = self._base.fork()
+        for alias, value in overrides.items():
+            node = run
+            for key in self._paths[alias]:
+                node = node._tree[key]
+            
+            # structural changes require a rebuild, otherwise only update alias
+            old = node._tree[alias]
+            node._tree[alias] = value
+            node._handler.touch(node, None if hasattr(old, '_tree') or hasattr(value, '_tree') else alias)
+        return run
+
+class ConcurrentConfig:
+    '''Config shared between threads with read-copy-update semantics. Readers never take a lock: lookups are
+    served from the published version, an immutable FrozenConfig. Writers batch their changes in a fork of
+    the config and publish them at once as a new version, such that readers see all changes of a batch or none.'''
+    def __init__(self, config:Config | BaseConfig):
+        # config is owned by the ConcurrentConfig from here on, only change it through write
+        self._config = config
+        self._lock = threading.RLock()
+        self._draft = None
+        self._published = config.freeze()
+        self._version = 0
+
+    @property
+    def strict(self) -> bool:
+        return self._config._strict
+
+    @property
+    def config(self) -> FrozenConfig:
+        # published version: keep a reference to read several parameters from the same version
+        return self._published
+
+    @property
+    def version(self) -> int:
+        # number of versions published since creation
+        return self._version
+
+    @contextmanager
+    def write(self) -> Iterator[Config | BaseConfig]:
+        # batch of changes, published when the block exits without an exception. Writers are serialised,
+        # a nested block joins the batch of the outer one
+        with self._lock:
+            if not self._draft is None:
+                yield self._draft
+                return
+
+            draft = self._draft = self._config.fork()
+            try:
+                yield draft
+            finally:
+                self._draft = None
+
+            # compile the new version before it is visible to readers, only recompiling the changed groups
+            if ConfigHandler.commit(self._config, draft):
+                published = self._config.freeze()
+
+                # a single reference swap: readers see either the old or the new version
+                self._published = published
+                self._version += 1
+
+    # lookups #
+    def __getattr__(self, __name:str) -> FrozenConfig | Any:
+        if __name[:1] == '_':
+            raise AttributeError(__name)
+        return getattr(self._published, __name)
+
+    def get(self, name:str, default:Any=None) -> FrozenConfig | Any:
+        # dot search that returns default if name is not registered, without raising or warning
+        if name[:1] == '_':
+            return default
+        index = type(self._published).__dict__
+        return FrozenConfig._value_(index[name]) if name in index else default
+
+    def get_many(self, names:list[str] | dict[str, Any], default:Any=None) -> list[Any]:
+        # dot search of many names in the same version, a dict of {name: default} gives a default per name
+        index = type(self._published).__dict__
+        defaults = names if isinstance(names, dict) else dict.fromkeys(names, default)
+        return [FrozenConfig._value_(index[name]) if name[:1] != '_' and name in index else default for name, default in defaults.items()]
+
+    def __contains__(self, __key:str) -> bool:
+        return __key in self._published
+
+    def __iter__(self):
+        return iter(self._published)
 
-        # parse known args
-        self._parsed_args = self.parse_known_args()[0]
+    def __repr__(self) -> str:
+        return repr(self._published)
+
+    def __str__(self) -> str:
+        return str(self._published)
 
-        # go into dict
-        for arg, value in self._parsed_args.__dict__.items():
+class FrozenConfig:
+    '''Immutable compiled config. Every group is an instance of a generated class that holds every alias
+    its dot search can find as a class attribute, such that lookups are plain attribute loads.'''
+    __slots__ = ('_name', '_strict', '_tree')
 
-            # if value is None
-            if value is None:
+    # flattened aliases in dot search order
+    _aliases_: tuple[str, ...] = ()
 
-                # try to match config registry
-                # if strict and no match raise error
-                if self._fallback_config._strict:
-                    try:
-                        self._parsed_args.__dict__[arg] = self._fallback_config.__getattr__(arg)
-                    except AttributeError:
-                        raise DefaultNotRegisteredError(arg)
-                    
-                # otherwise default to None if no match
-                # and warn user of no match
+    @classmethod
+    def compile(cls, config:Config | BaseConfig | FrozenConfig) -> FrozenConfig:
+        groups = dict()
+
+        def group(config:Config | BaseConfig | FrozenConfig) -> FrozenConfig:
+            # compile every group once, children before parents
+            if id(config) in groups:
+                return groups[id(config)][0]
+
+            # the compiled copy of a group is kept by its handler until the group or any group below it changes
+            # (frozen configs have no handler, neither do the states of unpickled frozen configs)
+            handler = getattr(config, '__dict__', {}).get('_handler')
+            if not (handler is None or handler._frozen is None):
+                groups[id(config)] = (handler._frozen, config)
+                return handler._frozen
+            
+            tree = {alias:group(value) if hasattr(value, '_tree') else value for alias, value in config._tree.items()}
+
+            # flattened index in the order of the dot search: own level first, then child by child
+            index, blocked = dict(), set()
+            for alias, value in tree.items():
+                if value is None:
+                    blocked.add(alias)
                 else:
-                    try:
-                        with warnings.catch_warnings(action='error'):
-                            self._parsed_args.__dict__[arg] = self._fallback_config.__getattr__(arg)
-                    except UserWarning:
-                        warnings.warn(f'No default argument for <{arg}> in the fallback config: defaulted to None', stacklevel=WARNING_STACK_LVL)
-                        self._parsed_args.__dict__[arg] = None
-                        
-    
-    def parse_args(self) -> Namespace:
-        # is _parsed_args is empty:
-        # means if with context manager was not used
-        # then force the context manager exit which loads
-        # the parsed args.
-        if self._parsed_args == {}:
-            # parse arguments
-            self.__exit__('forced', 102, None)
-        # return output product
-        return self._parsed_args
+                    index[alias] = cls._attribute_(value)
+            for child in tree.values():
+                if isinstance(child, FrozenConfig):
+                    attributes = type(child).__dict__
+                    for alias in child._aliases_:
+                        if not (alias in index or alias in blocked):
+                            index[alias] = attributes[alias]
+
+            # generate class holding the index
+            kind = type(config).__name__.removeprefix('Frozen')
+            frozenClass = type(f'Frozen{kind}', (cls,), {'__slots__':(), '__module__':cls.__module__, '_aliases_':tuple(index), **index})
+            
+            frozen = object.__new__(frozenClass)
+            object.__setattr__(frozen, '_name', config._name)
+            object.__setattr__(frozen, '_strict', config._strict)
+            object.__setattr__(frozen, '_tree', MappingProxyType(tree))
+            
+            groups[id(config)] = (frozen, config)
+            if not handler is None:
+                # index the group, such that changes to its subgroups are pushed up to it
+                handler.index(config)
+                handler._frozen = frozen
+            return frozen
         
+        return group(config)
+
+    @staticmethod
+    def _attribute_(value:Any) -> Any:
+        # class attribute holding value: descriptors, e.g. functions, would be bound to the instance
+        if hasattr(type(value), '__get__') or hasattr(type(value), '__set_name__'):
+            return staticmethod(value)
+        return value
+
+    @staticmethod
+    def _value_(attribute:Any) -> Any:
+        # inverse of _attribute_
+        return attribute.__func__ if isinstance(attribute, staticmethod) else attribute
+
+    @property
+    def strict(self) -> bool:
+        return self._strict
 
+    def __getattr__(self, __name:str) -> FrozenConfig | Any:
+        # only called for aliases that are not registered
+        # private names are never registered
+        if __name[:1] == '_':
+            raise AttributeError(__name)
+
+        # same behaviour as a regular config
+        ConfigHandler._unregistered(__name, self._strict, WARNING_STACK_LVL-1)
+
+    def __setattr__(self, __name:str, __value:Any) -> None:
+        raise AttributeError(f'config <{self._name}> is frozen and cannot be modified')
+    
+    def __delattr__(self, __name:str) -> None:
+        raise AttributeError(f'config <{self._name}> is frozen and cannot be modified')
+
+    def __contains__(self, __key:str) -> bool:
+        return __key in self._tree
+    
+    def __iter__(self):
+        for child in self._tree.values():
+            yield child
+
+    def __eq__(self, other) -> bool:
+        return self._tree == other._tree
+    
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        return self._name
+    
+    def __str__(self) -> str:
+        return ConfigFormatter.format(self)
+
+    def __reduce__(self):
+        # generated classes cannot be pickled by reference: recompile on load
+        return _compile_frozen_, (type(self).__name__, self._name, self._strict, dict(self._tree))
+
+def _compile_frozen_(kind:str, name:str, strict:bool, tree:dict) -> FrozenConfig:
+    # helper function for unpickling frozen configs
+    configClass = globals().get(kind.removeprefix('Frozen'), BaseConfig)
+    state = configClass.__new__(configClass)
+    state.__dict__.update(_name=name, _strict=strict, _tree=tree)
+    return FrozenConfig.compile(state)
+
+class SharedConfig:
+    '''Read-only snapshot of a config in shared memory. Pickling a SharedConfig only sends the name of
+    the memory block, such that workers attach to it instead of receiving a copy of the tree.'''
+    # Layout: every group is a node holding its flattened alias index as a table of entries and an
+    # open addressing hash table of slots pointing into it. Keys are stored as utf-8 and values
+    # as pickles, both only once. Groups are stored as nodes, also only once.
+    _magic = b'CFGSHM1\0'
+    _header = struct.Struct('<8sQ')           # magic, root node offset
+    _node = struct.Struct('<QI?II')           # name offset, name length, strict, number of entries, number of slots
+    _entry = struct.Struct('<QIQI??')         # key offset, key length, value offset, value length, is group, own level
+    _slot = struct.Struct('<I')               # entry number + 1, 0 if empty
+
+    __slots__ = ('_shm', '_buf', '_offset', '_owner')
+
+    def __init__(self, shm:shared_memory.SharedMemory, offset:int, owner:bool=False):
+        self._shm = shm
+        self._buf = shm.buf
+        self._offset = offset
+        self._owner = owner
+
+    @classmethod
+    def freeze(cls, config:Config | BaseConfig, name:str=None) -> SharedConfig:
+        # serialise and copy into a new shared memory block
+        from multiprocessing import shared_memory
+        data = cls._compile_(config)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        shm.buf[:len(data)] = data
+        return cls(shm, cls._header.unpack_from(data)[-1], owner=True)
+    
+    @classmethod
+    def attach(cls, name:str, offset:int=None) -> SharedConfig:
+        # attach to an existing snapshot, the process that froze it keeps ownership
+        from multiprocessing import parent_process, resource_tracker, shared_memory
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # python < 3.13 always tracks. Child processes share the resource tracker of the owner,
+            # any other process would unlink the block when it exits
+            shm = shared_memory.SharedMemory(name=name)
+            if parent_process() is None:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+        
+        magic, root = cls._header.unpack_from(shm.buf)
+        if magic != cls._magic:
+            shm.close()
+            raise ValueError(f'shared memory block <{name}> does not contain a config snapshot')
+        return cls(shm, root if offset is None else offset)
+    
+    @classmethod
+    def _compile_(cls, config:Config | BaseConfig) -> bytearray:
+        import pickle
+        data = bytearray(cls._header.size)
+        strings, values, nodes = dict(), dict(), dict()
+
+        def string(text:str) -> tuple[int, int]:
+            # store every string once
+            if not text in strings:
+                encoded = text.encode()
+                strings[text] = (len(data), len(encoded))
+                data.extend(encoded)
+            return strings[text]
+
+        def value(obj:Any) -> tuple[int, int]:
+            # store every value once
+            if not id(obj) in values:
+                pickled = pickle.dumps(obj, protocol=5)
+                values[id(obj)] = (len(data), len(pickled), obj)
+                data.extend(pickled)
+            return values[id(obj)][:2]
+
+        def node(group:Config | BaseConfig) -> int:
+            # store every group once, children before parents
+            if id(group) in nodes:
+                return nodes[id(group)][0]
+            
+            index = group._handler.index(group)
+            entries = list()
+            for alias, (path, obj) in index.items():
+                if hasattr(obj, '_tree'):
+                    location = (node(obj), 0, True)
+                else:
+                    location = (*value(obj), False)
+                entries.append((*string(alias), *location, path == ()))
+            
+            # hash table at most half full
+            nslots = 1 << max(1, (2*len(entries)).bit_length())
+            slots = [0]*nslots
+            for number, alias in enumerate(index):
+                slot = zlib.crc32(alias.encode()) & (nslots - 1)
+                while slots[slot]:
+                    slot = (slot + 1) & (nslots - 1)
+                slots[slot] = number + 1
+            
+            name = string(group._name)
+            offset = len(data)
+            data.extend(cls._node.pack(*name, group._strict, len(entries), nslots))
+            for entry in entries:
+                data.extend(cls._entry.pack(*entry))
+            for slot in slots:
+                data.extend(cls._slot.pack(slot))
+            nodes[id(group)] = (offset, group)
+            return offset
+
+        root = node(config)
+        cls._header.pack_into(data, 0, cls._magic, root)
+        return data
+
+    # lookups #
+    def _entries_(self) -> tuple[int, bool, int, int]:
+        # return start of entry table, strict, number of entries and number of slots
+        _, _, strict, count, nslots = self._node.unpack_from(self._buf, self._offset)
+        return self._offset + self._node.size, strict, count, nslots
+
+    def _load_(self, entry:int) -> tuple[str, Any, bool]:
+        # return alias, value and own level of entry
+        keyoffset, keylength, offset, length, group, own = self._entry.unpack_from(self._buf, entry)
+        alias = bytes(self._buf[keyoffset:keyoffset+keylength]).decode()
+        if group:
+            return alias, type(self)(self._shm, offset), own
+        import pickle
+        return alias, pickle.loads(self._buf[offset:offset+length]), own
+
+    def lookup(self, __name:str) -> tuple[bool, Any]:
+        # return (found, value) of the first match of alias in the frozen dot search
+        table, _, count, nslots = self._entries_()
+        slots = table + count*self._entry.size
+        key = __name.encode()
+
+        slot = zlib.crc32(key) & (nslots - 1)
+        while True:
+            number = self._slot.unpack_from(self._buf, slots + slot*self._slot.size)[0]
+            if number == 0:
+                return False, None
+            
+            entry = table + (number - 1)*self._entry.size
+            keyoffset, keylength = self._entry.unpack_from(self._buf, entry)[:2]
+            if self._buf[keyoffset:keyoffset+keylength] == key:
+                return True, self._load_(entry)[1]
+            slot = (slot + 1) & (nslots - 1)
+
+    @property
+    def _name(self) -> str:
+        offset, length = self._node.unpack_from(self._buf, self._offset)[:2]
+        return bytes(self._buf[offset:offset+length]).decode()
+    
+    @property
+    def _strict(self) -> bool:
+        return self._entries_()[1]
+    
+    @property
+    def strict(self) -> bool:
+        return self._strict
+    
+    @property
+    def name(self) -> str:
+        # name of the shared memory block to attach to
+        return self._shm.name
+
+    def __getattr__(self, __name:str) -> SharedConfig | Any:
+        # private names are never registered
+        if __name[:1] == '_':
+            raise AttributeError(__name)
+        
+        found, value = self.lookup(__name)
+        if found:
+            return value
+        
+        # same behaviour as a regular config
+        ConfigHandler._unregistered(__name, self._strict, WARNING_STACK_LVL-1)
+
+    def __contains__(self, __key:str) -> bool:
+        table, _, count, _ = self._entries_()
+        return any(alias == __key for alias, _, own in (self._load_(table + number*self._entry.size) for number in range(count)) if own)
+    
+    def __iter__(self):
+        # own level values in registration order
+        table, _, count, _ = self._entries_()
+        for number in range(count):
+            _, value, own = self._load_(table + number*self._entry.size)
+            if own:
+                yield value
+
+    def __repr__(self) -> str:
+        return self._name
+
+    # sharing #
+    def __reduce__(self):
+        # send the name of the memory block, never its content
+        return type(self).attach, (self._shm.name, self._offset)
+
+    def close(self) -> None:
+        # detach from the memory block
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        # free the memory block, only to be called by the owner once all workers are done
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedConfig:
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+# serialisation formats #
+ConfigIO.add_backend(YAMLBackend())
+ConfigIO.add_backend(JSONBackend())
+ConfigIO.add_backend(TOMLBackend())
+ConfigIO.add_backend(MsgpackBackend())
+
+# config classes #
+ConfigIO.add_config_class(Config)
+ConfigIO.add_config_class(BaseConfig)
+ConfigIO.add_config_class(FileConfig)
+ConfigIO.add_config_class(ModelConfig)
+ConfigIO.add_config_class(ArrayConfig)
+
+# YAML representation #
+# ConfigLoader and ConfigDumper are defined by _yaml_ on first use, together with load, dump and YAMLError
+def _yaml_() -> None:
+    # import yaml and define the safe loader and dumper of the config objects, once
+    global ConfigLoader, ConfigDumper, YAMLError, load, dump
+    if not 'ConfigLoader' in globals():
+        import yaml
+        try:
+            # use the libyaml bindings when available
+            from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+        except ImportError:
+            from yaml import SafeLoader, SafeDumper
+
+        class ConfigLoader(SafeLoader):
+            'Safe YAML loader that constructs the config objects from their tags.'
+
+        class ConfigDumper(SafeDumper):
+            'Safe YAML dumper that represents the config objects as tagged mappings.'
+
+        YAMLError, load, dump = yaml.YAMLError, yaml.load, yaml.dump
+        for configClass, tag in ConfigIO._tags.items():
+            _add_yaml_class_(configClass, '!'+tag)
+
+        # the tree of a fork is written as a plain mapping
+        ConfigDumper.add_representer(ForkTree, SafeDumper.represent_dict)
+
+        ConfigDumper.add_multi_representer(PurePath, _represent_path)
+        ConfigLoader.add_constructor('!Path', _construct_path)
+        ConfigLoader.add_constructor('!Array', _construct_array)
+        for pathClass in ('Path', 'PosixPath', 'WindowsPath', 'PurePath', 'PurePosixPath', 'PureWindowsPath'):
+            ConfigLoader.add_constructor(f'tag:yaml.org,2002:python/object/apply:pathlib.{pathClass}', _construct_legacy_path)
+        ConfigLoader.add_constructor('tag:yaml.org,2002:python/object:configlib.configlib.ConfigHandler', _construct_legacy_handler)
+
+    # arrays only exist once numpy is imported, which may happen after yaml was set up
+    numpy = sys.modules.get('numpy')
+    if not (numpy is None or numpy.ndarray in ConfigDumper.yaml_multi_representers):
+        ConfigDumper.add_multi_representer(numpy.ndarray, _represent_array)
+        ConfigDumper.add_multi_representer(numpy.generic, _represent_numpy_scalar)
+
+def _add_yaml_class_(configClass:Any, tag:str) -> None:
+    # tagged representation of a config class, see ConfigIO.add_config_class
+    def represent(dumper:ConfigDumper, config:BaseConfig):
+        return dumper.represent_mapping(tag, {'name':config._name, 'strict':config._strict, 'tree':config._tree})
+
+    def construct(loader:ConfigLoader, node):
+        state = loader.construct_mapping(node, deep=True)
+        return configClass._from_state_(state['name'], state['strict'], state['tree'])
+
+    def construct_legacy(loader:ConfigLoader, node):
+        # files written before the tagged format contain the python object state
+        state = loader.construct_mapping(node, deep=True)
+        return configClass._from_state_(state['_name'], state['_strict'], state['_tree'])
+
+    ConfigDumper.add_representer(configClass, represent)
+    ConfigLoader.add_constructor(tag, construct)
+    ConfigLoader.add_constructor(f'tag:yaml.org,2002:python/object:{configClass.__module__}.{configClass.__qualname__}', construct_legacy)
+
+def _construct_legacy_handler(loader:ConfigLoader, node) -> ConfigHandler:
+    # files written before the tagged format contain the handler state, which is rebuild instead
+    return ConfigHandler()
+
+def _represent_path(dumper:ConfigDumper, path:PurePath):
+    return dumper.represent_scalar('!Path', str(path))
+
+def _construct_path(loader:ConfigLoader, node) -> Path:
+    return Path(loader.construct_scalar(node))
+
+def _construct_legacy_path(loader:ConfigLoader, node) -> Path:
+    # files written before the tagged format contain the path parts
+    return Path(*loader.construct_sequence(node))
+
+def _represent_array(dumper:ConfigDumper, array:Any):
+    if ConfigIO.__inline__(array):
+        return dumper.represent_data(array.item())
+    return dumper.represent_scalar('!Array', ConfigIO.__savearray__(array))
+
+def _represent_numpy_scalar(dumper:ConfigDumper, value:Any):
+    # numpy scalars, e.g. numpy.float64, are written as the corresponding python value
+    return dumper.represent_data(value.item())
+
+def _construct_array(loader:ConfigLoader, node) -> Any:
+    return ConfigIO.__loadarray__(loader.construct_scalar(node))
+
+# parts of the module that are set up on first use
+def __getattr__(name:str) -> Any:
+    if name in ('ConfigLoader', 'ConfigDumper'):
+        _yaml_()
+        return globals()[name]
+    if name == 'ArgumentParserWithFallback':
+        # needs argparse
+        from .parser import ArgumentParserWithFallback
+        return ArgumentParserWithFallback
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 def UnitTests() -> bool:
 
@@ -568,13 +3395,169 @@ def UnitTests() -> bool:
     cfg.writeto()
     del cfg
     cfg = Config.readfrom()
-    
+
+    # numpy scalars are written as python values
+    numpy = _optional_('numpy')
+    if not numpy is None:
+        cfg.add_parameter('scale', numpy.float64(1.5))
+        cfg.writeto()
+        assert Config.readfrom().scale == 1.5
+
+    # reads leave no snapshot behind unless the cache is turned on
+    assert not (DEFAULT_PATH_TO_CONFIG.parent/'.config.yml.cache').exists()
+
+    # lazy and eager reads resolve the same, whatever the order of the groups in the file
+    path = DEFAULT_PATH_TO_CONFIG.parent/'order.yml'
+    with open(path, 'w') as fp:
+        fp.write(''.join(f'{alias}: !BaseConfig\n  name: {alias}\n  strict: false\n  tree:\n    order: {order}\n    {alias}_c: 0\n' for alias, order in [('fitting', 3), ('general', 1), ('plot', 2)]))
+    eager, lazy = Config.readfrom(path), Config.readfrom(path, lazy=True)
+    assert eager.order == lazy.order == 1 and lazy.plot_c == eager.plot_c
+    assert list(lazy._tree) == list(eager._tree) == ['general', 'fitting', 'plot']
+    path.unlink()
+
+    # layered configs updated layer by layer resolve the same as ones built from the same layers
+    layered = LayeredConfig({'g1':{'c':1}}, {'g2':{'c':2}})
+    layered.set_layer(0, {'g2':{'c':3}, 'g1':{'c':1}})
+    layered.add_layer({'g3':{'d':4}, 'g2':{'d':5}})
+    layered.remove_layer(1)
+    fresh = LayeredConfig({'g2':{'c':3}, 'g1':{'c':1}}, {'g3':{'d':4}, 'g2':{'d':5}})
+    assert (layered.c, layered.d) == (fresh.c, fresh.d) == (3, 5)
+    assert list(layered.config._tree) == list(fresh.config._tree)
+
+    # the printed tree can be limited in depth, entries per group and groups
+    shown = Config.from_dict({'a':1, 'fitting':{'order':1, 'bounds':{'low':0}}, 'plot':{'x':1}})
+    lines = lambda **kwargs: ConfigFormatter.format(shown, **kwargs).split('\n')[1:]
+    assert lines(max_depth=0) == lines(max_children=0) == ['└──... (3 more)']
+    assert lines(max_depth=1) == ['├──general: ... (1 entries)', '├──fitting: ... (2 entries)', '└──plot: ... (1 entries)']
+    assert lines(max_children=1) == ['├──general:', '|  └──a: 1', '└──... (2 more)']
+    assert lines(groups=['plot']) == ['└──plot:', '   └──x: 1']
+    assert lines(groups=lambda alias, group: alias != 'bounds')[2:] == ['├──fitting:', '|  └──order: 1', '└──plot:', '   └──x: 1']
+    try:
+        lines(max_depth=-1)
+        assert False
+    except ValueError:
+        pass
+
+    # frozen configs survive a pickle round trip
+    import pickle
+    frozen = pickle.loads(pickle.dumps(cfg.freeze()))
+    assert frozen.hi == "hello world"
+
+    # forks follow groups replaced in the origin, unless they changed them
+    cfg = Config.from_dict({'fitting':{'order':2}})
+    fork = cfg.fork()
+    fork.get('order')
+    cfg.add_group('fitting', BaseConfig, overwrite=True).add_parameter('order', 7)
+    assert fork.order == 7
+
+    # and origins that replace their whole tree
+    cfg.fitting.set_tree({'d':0})
+    cfg.add_parameter('order', 8, group='fitting', overwrite=True)
+    assert fork.order == 8
+    cfg.writeto()
+    cfg.add_parameter('order', 9, group='fitting', overwrite=True)
+    fork = cfg.fork()
+    cfg.reload(DEFAULT_PATH_TO_CONFIG)
+    assert fork.order == 8
+
+    # sweep runs do not share their changes
+    cfg = Config.from_dict({'fitting':{'order':2, 'c':1}})
+    sweep = cfg.sweep({'order':[1, 2, 3]})
+    run = sweep[1]
+    run.add_parameter('c', 9, group='fitting', overwrite=True)
+    assert (run.c, cfg.c, sweep[0].c, sweep[2].order) == (9, 1, 1, 3)
+
+    # functions are frozen as values, not as methods
+    cfg.add_parameter('model', abs)
+    cfg.add_parameter('loss', lambda x: 2*x)
+    frozen = cfg.freeze()
+    assert frozen.model(-1) == 1 and frozen.loss(1) == 2
+    assert ConcurrentConfig(cfg).get('loss') is cfg.loss
+
+    # values changed in place are written
+    cfg = Config()
+    cfg.add_parameter('bounds', [1, 2])
+    cfg.writeto()
+    cfg.bounds.append(3)
+    cfg.writeto()
+    assert Config.readfrom().bounds == [1, 2, 3]
+
+    # fingerprints see values changed in place
+    cfg = Config.from_dict({'fitting':{'bounds':[1, 2]}, 'order':2})
+    fingerprint = cfg.fingerprint()
+    cfg.bounds.append(3)
+    assert cfg.fingerprint() != fingerprint
+    assert cfg.fingerprint() == Config.from_dict({'fitting':{'bounds':[1, 2, 3]}, 'order':2}).fingerprint()
+
+    # get and get_many are profiled, e.g. the lookups of the argument parser
+    from .parser import ArgumentParserWithFallback
+    cfg = Config.from_dict({'fitting':{'order':2, 'c':1, 'd':0}})
+    parser = ArgumentParserWithFallback(fallback=cfg)
+    parser.add_argument('--order', type=int)
+    # parse an empty command line, not the one of the test run
+    parser.parse_known_args = partial(parser.parse_known_args, [])
+    with ConfigProfiler() as profiler:
+        assert parser.parse_args().order == 2
+        assert cfg.get('c') == 1
+    assert profiler.stats()['lookups']['order']['hits'] == 1 and 'd' in profiler.unused(cfg)
+    assert not ('order' in profiler.unused(cfg) or 'c' in profiler.unused(cfg))
+
+    # reload re-reads the file the config was read from
+    try:
+        cfg.reload()
+        assert False
+    except ValueError:
+        pass
+    import logging
+    for suffix in ('.json', '.toml', '.msgpack'):
+        path = DEFAULT_PATH_TO_CONFIG.parent/f'reload{suffix}'
+        Config.from_dict({'order':1}).writeto(path)
+        cfg = Config.readfrom(path)
+        Config.from_dict({'order':2}).writeto(path)
+        assert 'order' in cfg.reload() and cfg.order == 2
+
+        # and a watcher keeps the current config when the file is saved halfway
+        watcher = ConfigWatcher(cfg)
+        path.write_bytes(path.read_bytes()[:-7])
+        logging.disable(logging.WARNING)
+        try:
+            assert watcher.check() == set() and cfg.order == 2
+        finally:
+            logging.disable(logging.NOTSET)
+        path.unlink()
+
+    # the order of the entries survives a TOML round trip, so does the fingerprint
+    if not _optional_('tomllib', 'tomli') is None:
+        path = DEFAULT_PATH_TO_CONFIG.parent/'order.toml'
+        cfg = Config.from_dict({'fitting':{'order':1, 'bounds':{'low':0}}})
+        cfg.add_parameter('method', 'leastsq', group='fitting')
+        cfg.writeto(path)
+        read = Config.readfrom(path)
+        assert list(read.fitting._tree) == ['order', 'bounds', 'method'] and read.fingerprint() == cfg.fingerprint()
+        path.unlink()
+
+    # 0-d arrays are written inline, and sidecars of replaced arrays can be pruned
+    if not numpy is None:
+        path = DEFAULT_PATH_TO_CONFIG.parent/'tables.yml'
+        cfg = Config()
+        group = cfg.add_group('table', ArrayConfig)
+        group.add_parameters({'guess':numpy.arange(3), 'scale':2.5})
+        cfg.writeto(path)
+        group.add_parameter('guess', numpy.arange(4), overwrite=True)
+        cfg.writeto(path)
+        sidecars = path.parent/'tables.arrays'
+        assert len(list(sidecars.iterdir())) == 2 and len(ConfigIO.prune(path)) == 1
+        assert Config.readfrom(path).guess.shape == (4,) and Config.readfrom(path).scale == 2.5
+        for sidecar in sidecars.iterdir():
+            sidecar.unlink()
+        sidecars.rmdir()
+        path.unlink()
 
     return True
 
 if __name__ == '__main__':
     if UnitTests():
         # log succesful
-        logging.info('Package testes succesfully')
+        _log_('info', 'Package testes succesfully')
     else:
-        logging.warning('Package critically failed Unit testing!')
\ No newline at end of file
+        _log_('warning', 'Package critically failed Unit testing!')
\ No newline at end of file
@@ -0,0 +1,95 @@
+# future annotations
+from __future__ import annotations
+
+# buildin
+from argparse import ArgumentParser, Namespace
+import os
+import warnings
+
+# package
+from .configlib import Config, DefaultNotRegisteredError, WARNING_STACK_LVL
+
+# argparse is only imported when the parser is used, see configlib.__getattr__
+__all__ = ['ArgumentParserWithFallback']
+
+class ArgumentParserWithFallback(ArgumentParser):
+    def __init__(self, fallback:Config|None=None, env_prefix:str|None=None, **kwargs) -> None:
+        # get standard behaviour
+        super().__init__(**kwargs)
+
+        # without fallback config and env_prefix this is a regular argument parser
+        self._fallback_config = fallback
+        self._env_prefix = env_prefix
+        
+        # initialise return product 
+        self._parsed_args = dict()
+
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        # parse known args
+        self._parsed_args = self.parse_known_args()[0]
+        args = self._parsed_args.__dict__
+
+        # arguments that were not given, resolved layer by layer: environment, then config
+        pending = [arg for arg, value in args.items() if value is None]
+        if pending and not self._env_prefix is None:
+            pending = self._resolve_environ_(args, pending)
+        if not pending or self._fallback_config is None:
+            return
+        
+        # look up all remaining arguments at once in the alias index of the config
+        missing = object()
+        unresolved = list()
+        for arg, value in zip(pending, self._fallback_config.get_many(pending, missing)):
+            if value is missing:
+                unresolved.append(arg)
+            else:
+                args[arg] = value
+        if not unresolved:
+            return
+
+        # if strict and no match raise error
+        if self._fallback_config._strict:
+            raise DefaultNotRegisteredError(unresolved)
+        
+        # otherwise default to None and warn user of every argument without match
+        names = ', '.join(f'<{arg}>' for arg in unresolved)
+        warnings.warn(f'No default argument for {names} in the fallback config: defaulted to None', stacklevel=WARNING_STACK_LVL)
+
+    def _resolve_environ_(self, args:dict, pending:list[str]) -> list[str]:
+        # take arguments from <env_prefix><ARG> environment variables, converted by the type of the argument.
+        # returns the arguments that are still pending
+        prefix = self._env_prefix
+        environ = {key[len(prefix):]:value for key, value in os.environ.items() if key.startswith(prefix)}
+        if not environ:
+            return pending
+        
+        types = {action.dest:action.type for action in self._actions}
+        remaining = list()
+        for arg in pending:
+            value = environ.get(arg.upper())
+            if value is None:
+                remaining.append(arg)
+                continue
+            convert = types.get(arg)
+            try:
+                args[arg] = convert(value) if callable(convert) else value
+            except (TypeError, ValueError):
+                # same as argparse does for invalid values on the command line
+                self.error(f'invalid value for {prefix}{arg.upper()}: {value!r}')
+        return remaining
+    
+    def parse_args(self) -> Namespace:
+        # is _parsed_args is empty:
+        # means if with context manager was not used
+        # then force the context manager exit which loads
+        # the parsed args.
+        if self._parsed_args == {}:
+            # parse arguments
+            self.__exit__('forced', 102, None)
+        # return output product
+        return self._parsed_args
+        
@@ -10,6 +10,11 @@ setup(
     version='1.0.0b0',
     url='https://github.com/NuggetOfficial/configlib',
     install_requires=['PyYAML>=6.0.1'],
+    extras_require={
+        'json':['orjson'],
+        'msgpack':['msgpack'],
+        'toml':['tomli; python_version < "3.11"'],
+    },
     python_requires='>=3.10.0',
     license='gpl-3.0',
     classifiers=[
@@ -0,0 +1,128 @@
+'''Read-copy-update stress test of ConcurrentConfig.
+
+Reader threads look up parameters of a ConcurrentConfig while a writer thread keeps publishing batches of changes.
+Every batch sets two parameters in different groups to the same value, such that a reader that sees half of a batch
+is caught. The test fails if a reader sees an inconsistent version or raises, if no versions were published, or if
+the read throughput of the most threads falls below half of the throughput of a single reader, i.e. if readers
+block each other or the writer. With the GIL the total throughput stays about constant with the number of threads,
+on free-threaded builds it grows with it. Run with -v to print the throughput per number of threads, next to that
+of readers that share a lock with the writer on a plain Config:
+
+    python tests/concurrency.py -v
+'''
+# buildin
+import sys
+import threading
+import time
+
+# local
+from configlib import Config, ConcurrentConfig
+
+THREADS = [1, 2, 4, 8]
+DURATION = 0.5
+
+# two parameters that every batch changes together, and one that is found by the dot search
+FIRST, SECOND, DEEP = 'first', 'second', 'p7_7'
+
+def build(groups:int=20, parameters:int=50) -> Config:
+    tree = {f'group{g}':{f'p{g}_{p}':p for p in range(parameters)} for g in range(groups)}
+    tree[FIRST] = 0
+    tree[f'group{groups-1}'][SECOND] = 0
+    return Config.from_dict(tree)
+
+class Lock:
+    # readers and writer of a plain config share a lock, for comparison
+    def __init__(self, config:Config):
+        self.config = config
+        self.lock = threading.Lock()
+        self.version = 0
+
+    def read(self) -> tuple:
+        with self.lock:
+            config = self.config
+            return getattr(config, FIRST), getattr(config, SECOND), getattr(config, DEEP)
+
+    def write(self, value:int) -> None:
+        with self.lock:
+            self.config.add_parameter(FIRST, value, overwrite=True)
+            self.config.add_parameter(SECOND, value, group='group19', overwrite=True)
+            self.version += 1
+
+class RCU:
+    # readers take the published version, the writer publishes a batch
+    def __init__(self, config:Config):
+        self.config = ConcurrentConfig(config)
+
+    @property
+    def version(self) -> int:
+        return self.config.version
+
+    def read(self) -> tuple:
+        version = self.config.config
+        return getattr(version, FIRST), getattr(version, SECOND), getattr(version, DEEP)
+
+    def write(self, value:int) -> None:
+        with self.config.write() as draft:
+            draft.add_parameter(FIRST, value, overwrite=True)
+            draft.add_parameter(SECOND, value, group='group19', overwrite=True)
+
+def run(mode:type, threads:int, duration:float=DURATION) -> tuple[float, int]:
+    # reads per second of all readers together and number of published versions
+    shared = mode(build())
+    stop = threading.Event()
+    counts, errors = [0]*threads, list()
+
+    def reader(number:int) -> None:
+        reads = 0
+        try:
+            while not stop.is_set():
+                for _ in range(100):
+                    first, second, _ = shared.read()
+                    if first != second:
+                        raise AssertionError(f'reader saw half of a batch: {first} != {second}')
+                reads += 100
+        except Exception as error:
+            errors.append(error)
+        counts[number] = reads
+
+    def writer() -> None:
+        value = 0
+        try:
+            while not stop.is_set():
+                value += 1
+                shared.write(value)
+                time.sleep(1e-3)
+        except Exception as error:
+            errors.append(error)
+
+    workers = [threading.Thread(target=reader, args=(number,)) for number in range(threads)] + [threading.Thread(target=writer)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    if errors:
+        raise errors[0]
+    return sum(counts)/elapsed, shared.version
+
+def ConcurrencyTests(verbose:bool=False) -> bool:
+    throughput = dict()
+    for threads in THREADS:
+        throughput[threads], versions = run(RCU, threads)
+        if versions == 0:
+            raise AssertionError(f'no versions were published with {threads} readers')
+
+        if verbose:
+            locked, _ = run(Lock, threads)
+            print(f'{threads:>2} readers: {throughput[threads]:>12,.0f} reads/s read-copy-update, {locked:>12,.0f} reads/s lock, {versions} versions published')
+
+    if throughput[THREADS[-1]] < throughput[THREADS[0]]/2:
+        raise AssertionError(f'read throughput dropped from {throughput[THREADS[0]]:,.0f}/s with {THREADS[0]} to {throughput[THREADS[-1]]:,.0f}/s with {THREADS[-1]} readers')
+    return True
+
+if __name__ == '__main__':
+    ConcurrencyTests(verbose='-v' in sys.argv[1:])
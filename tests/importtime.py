@@ -0,0 +1,78 @@
+'''Import cost regression test of configlib.
+
+Imports configlib in fresh interpreters under python -X importtime and fails if the import takes longer
+than its budget, or if a dependency that should only be imported on first use is imported. Bytecode is
+cached in a temporary directory, such that the budget does not include compiling the package. On slow
+machines the budgets can be scaled with the CONFIGLIB_IMPORT_BUDGET environment variable:
+
+    python tests/importtime.py
+    CONFIGLIB_IMPORT_BUDGET=2 python tests/importtime.py
+'''
+# buildin
+from pathlib import Path
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# statement: budget in milliseconds. The package imports its submodules on first use of their names,
+# which importtime does not report, so the main module is imported explicitly
+BUDGETS = {
+    'import configlib':10,
+    'import configlib.configlib':60,
+}
+
+# only imported by the code paths that need them
+DEFERRED = ['yaml', 'numpy', 'orjson', 'msgpack', 'tomllib', 'argparse', 'asyncio', 'logging', 'multiprocessing', 'concurrent.futures', 'tempfile']
+
+def importtime(statement:str, env:dict) -> dict[str, int]:
+    # {module: cumulative microseconds} of the modules imported directly by statement
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], env=env, capture_output=True, text=True, check=True)
+    times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if name[1:2] != ' ':
+            times[name.strip()] = int(cumulative)
+    return times
+
+def cost(statement:str, env:dict, repeat:int=5) -> float:
+    # fastest of repeat imports in milliseconds, without the imports of the interpreter startup
+    startup = importtime('pass', env)
+    best = None
+    for _ in range(repeat):
+        times = importtime(statement, env)
+        total = sum(time for name, time in times.items() if not name in startup)/1e3
+        best = total if best is None else min(best, total)
+    return best
+
+def deferred(env:dict) -> list[str]:
+    # deferred dependencies imported by importing configlib and creating a config
+    statement = f'import sys; from configlib import Config; Config(); print(*[name for name in {DEFERRED!r} if name in sys.modules])'
+    result = subprocess.run([sys.executable, '-c', statement], env=env, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+def ImportTests() -> bool:
+    factor = float(os.environ.get('CONFIGLIB_IMPORT_BUDGET', 1))
+    with tempfile.TemporaryDirectory() as cachedir:
+        env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONPYCACHEPREFIX=cachedir)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+        # compile the package once
+        subprocess.run([sys.executable, '-c', 'import configlib.configlib, configlib.parser'], env=env, check=True)
+
+        imported = deferred(env)
+        if imported:
+            raise ImportError(f'importing configlib imported {", ".join(imported)}, which should only be imported on first use')
+
+        for statement, budget in BUDGETS.items():
+            milliseconds = cost(statement, env)
+            if milliseconds > budget*factor:
+                raise ImportError(f'{statement!r} took {milliseconds:.1f} ms, over its budget of {budget*factor:.1f} ms')
+    return True
+
+if __name__ == '__main__':
+    ImportTests()